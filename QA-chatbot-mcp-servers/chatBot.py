@@ -1,7 +1,7 @@
 import streamlit as st
 import os
 from dotenv import load_dotenv
-from googleapiclient.discovery import build
+import httpx
 
 st.set_page_config(page_title="Simple Search Chat Bot")
 
@@ -17,14 +17,35 @@ if not GOOGLE_SEARCH_API_KEY or not GOOGLE_SEARCH_CX:
     st.error("Please set GOOGLE_SEARCH_API_KEY and GOOGLE_SEARCH_CX in a .env file to use the chatbot.")
     st.stop()
 
-# Build the Google Custom Search service
-_search_service = build("customsearch", "v1", developerKey=GOOGLE_SEARCH_API_KEY)
+SEARCH_ENDPOINT = "https://www.googleapis.com/customsearch/v1"
+
+@st.cache_resource
+def _get_http_client() -> httpx.Client:
+    """Pooled HTTP client shared across reruns (keep-alive connections)."""
+    return httpx.Client(
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_search(query: str, num_results: int):
+    """Hit the Search API; identical queries within the TTL reuse the cached result."""
+    response = _get_http_client().get(
+        SEARCH_ENDPOINT,
+        params={
+            "key": GOOGLE_SEARCH_API_KEY,
+            "cx": GOOGLE_SEARCH_CX,
+            "q": query,
+            "num": num_results,
+        },
+    )
+    response.raise_for_status()
+    return response.json().get("items", [])
 
 def get_google_results(query: str, *, num_results: int = 5):
     """Return a list of search-result dicts for the query."""
     try:
-        response = _search_service.cse().list(q=query, cx=GOOGLE_SEARCH_CX, num=num_results).execute()
-        return response.get("items", [])
+        return _cached_search(query, num_results)
     except Exception as exc:
         st.error(f"Error while querying Google Search API: {exc}")
         return []
@@ -47,13 +68,21 @@ if submit_button and input_text:
     st.subheader("Top Results")
     if not results:
         st.info("No results found.")
-    for idx, item in enumerate(results, start=1):
-        title = item.get("title")
-        link = item.get("link")
-        snippet = item.get("snippet")
-        st.markdown(f"**{idx}. [{title}]({link})**\n\n{snippet}")
-        st.session_state["chat_history"].append(("Result", f"{title} – {link}"))
+    else:
+        # Render all results in one markdown pass and store a single
+        # history row per turn (per-chunk appends grow history quadratically)
+        result_lines = []
+        for idx, item in enumerate(results, start=1):
+            title = item.get("title")
+            link = item.get("link")
+            snippet = item.get("snippet")
+            result_lines.append(f"**{idx}. [{title}]({link})**\n\n{snippet}")
+        st.markdown("\n\n".join(result_lines))
+        st.session_state["chat_history"].append(
+            ("Bot", "\n".join(f"{item.get('title')} – {item.get('link')}" for item in results))
+        )
 
 st.subheader("Chat History")
-for role, text in st.session_state["chat_history"]:
-    st.write(f"{role}: {text}")
\ No newline at end of file
+with st.container():
+    for role, text in st.session_state["chat_history"]:
+        st.write(f"{role}: {text}")
\ No newline at end of file
@@ -1,6 +1,9 @@
 # app/database.py
 
 from sqlmodel import SQLModel, Field, create_engine, Session, select, text
+from sqlalchemy import event, Index
+from sqlalchemy.orm import sessionmaker
+from contextlib import contextmanager
 from typing import Optional, List
 from datetime import datetime
 import json
@@ -27,6 +30,10 @@ class Document(SQLModel, table=True):
     sentiment_analysis: Optional[str] = Field(default=None)
     keywords: Optional[str] = Field(default=None)
     readability_scores: Optional[str] = Field(default=None)
+    analysis_version: Optional[str] = Field(default=None)  # Hash of the cached analysis
+
+    # Index for recency queries
+    __table_args__ = (Index('ix_document_updated', 'updated_at'),)
 
 class DocumentAnalysis(SQLModel, table=True):
     """Separate table for caching analysis results"""
@@ -37,6 +44,9 @@ class DocumentAnalysis(SQLModel, table=True):
     analysis_data: str                                # JSON data
     created_at: datetime = Field(default_factory=datetime.now)
 
+    # Compound index - lookups filter on both columns together
+    __table_args__ = (Index('ix_analysis_doc_type', 'document_id', 'analysis_type'),)
+
 # Database Setup
 DATABASE_URL = "sqlite:///./documents.db"
 
@@ -50,6 +60,15 @@ engine = create_engine(
     }
 )
 
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Set performance pragmas on every new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 def init_database():
     """Initialize database and create tables"""
     SQLModel.metadata.create_all(engine)
@@ -63,36 +82,62 @@ def init_database():
             )
         """))
         
-        # Create trigger to sync FTS table
+        # Create triggers to sync the FTS index. The table is external-content
+        # (content='document'), so FTS5 only stores the index and reads column
+        # values back from document - updates/deletes must use the documented
+        # 'delete' command form instead of plain UPDATE/DELETE
         session.execute(text("""
             CREATE TRIGGER IF NOT EXISTS document_fts_sync_insert AFTER INSERT ON document
             BEGIN
-                INSERT INTO document_fts(rowid, title, content, author) 
+                INSERT INTO document_fts(rowid, title, content, author)
                 VALUES (new.id, new.title, new.content, new.author);
             END
         """))
-        
+
         session.execute(text("""
             CREATE TRIGGER IF NOT EXISTS document_fts_sync_update AFTER UPDATE ON document
             BEGIN
-                UPDATE document_fts SET title=new.title, content=new.content, author=new.author 
-                WHERE rowid=new.id;
+                INSERT INTO document_fts(document_fts, rowid, title, content, author)
+                VALUES ('delete', old.id, old.title, old.content, old.author);
+                INSERT INTO document_fts(rowid, title, content, author)
+                VALUES (new.id, new.title, new.content, new.author);
             END
         """))
-        
+
         session.execute(text("""
             CREATE TRIGGER IF NOT EXISTS document_fts_sync_delete AFTER DELETE ON document
             BEGIN
-                DELETE FROM document_fts WHERE rowid=old.id;
+                INSERT INTO document_fts(document_fts, rowid, title, content, author)
+                VALUES ('delete', old.id, old.title, old.content, old.author);
             END
         """))
         
+        # Let SQLite gather planner statistics for the new indexes
+        session.execute(text("PRAGMA optimize"))
+
         session.commit()
         print("Database initialized with FTS support", file=sys.stderr)
 
+# Session factory - builds sessions once instead of re-constructing
+# transactional state per call
+SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
 def get_session():
     """Get database session"""
-    return Session(engine)
+    return SessionLocal()
+
+@contextmanager
+def session_scope():
+    """Provide a transactional scope around a series of operations"""
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
 
 # Database utility functions
 def get_document_by_id(document_id: int) -> Optional[Document]:
@@ -100,41 +145,77 @@ def get_document_by_id(document_id: int) -> Optional[Document]:
     with get_session() as session:
         return session.get(Document, document_id)
 
-def search_documents_fts(query: str, limit: int = 10) -> List[Document]:
-    """Search documents using Full-Text Search"""
+def search_documents_fts(query: str, limit: int = 10) -> List[tuple]:
+    """Search documents using Full-Text Search.
+
+    Returns (Document, bm25_score) tuples in ranking order; lower (more
+    negative) bm25 scores are better matches.
+    """
     with get_session() as session:
-        # FTS search query
-        stmt = session.execute(text("""
-            SELECT d.* FROM document d
-            JOIN document_fts fts ON d.id = fts.rowid
-            WHERE document_fts MATCH :query
-            ORDER BY rank
-            LIMIT :limit
-        """), {"query": query, "limit": limit})
-        
-        results = []
-        for row in stmt.fetchall():
-            # Convert row to Document object
-            doc_data = dict(zip(row.keys(), row))
-            results.append(Document(**doc_data))
-        
-        return results
+        # Materialize FTS matches in a CTE first so SQLite keeps using the
+        # FTS index (mixing MATCH with a JOIN in one WHERE clause makes the
+        # planner fall back to scanning the virtual table)
+        rows = session.execute(text("""
+            WITH fts_matches AS (
+                SELECT rowid, bm25(document_fts, 2.0, 1.0, 1.0) AS score
+                FROM document_fts
+                WHERE document_fts MATCH :query
+                ORDER BY score
+                LIMIT :limit
+            )
+            SELECT rowid, score FROM fts_matches
+        """), {"query": query, "limit": limit}).fetchall()
+
+        if not rows:
+            return []
+
+        # Load matching documents through the ORM and keep bm25 ranking order
+        doc_ids = [row[0] for row in rows]
+        docs = session.exec(select(Document).where(Document.id.in_(doc_ids))).all()
+        docs_by_id = {doc.id: doc for doc in docs}
+        return [(docs_by_id[doc_id], score) for doc_id, score in rows if doc_id in docs_by_id]
 
-def add_document_to_db(title: str, content: str, author: Optional[str] = None, source: Optional[str] = None) -> Document:
-    """Add new document to database"""
+def add_document_to_db(title: str, content: str, author: Optional[str] = None, source: Optional[str] = None,
+                       word_count: Optional[int] = None, sentence_count: Optional[int] = None,
+                       reading_time_minutes: Optional[float] = None) -> Document:
+    """Add new document to database.
+
+    Stats are set before the INSERT so ingest is a single round-trip
+    (no follow-up UPDATE of the freshly inserted row).
+    """
     with get_session() as session:
         doc = Document(
             title=title,
             content=content,
             author=author,
-            source=source
+            source=source,
+            word_count=word_count,
+            sentence_count=sentence_count,
+            reading_time_minutes=reading_time_minutes
         )
         session.add(doc)
         session.commit()
         session.refresh(doc)
         return doc
 
+def add_documents_bulk(items: List[dict]) -> List[Document]:
+    """Add multiple documents in a single transaction (one commit for all rows)"""
+    with get_session() as session:
+        docs = [Document(**item) for item in items]
+        session.add_all(docs)
+        session.commit()
+        for doc in docs:
+            session.refresh(doc)
+        return docs
+
 def get_all_documents() -> List[Document]:
     """Get all documents"""
     with get_session() as session:
-        return list(session.exec(select(Document)).all()) 
\ No newline at end of file
+        return list(session.exec(select(Document)).all())
+
+def list_document_summaries() -> List[tuple]:
+    """Get (id, title, word_count) for all documents without loading content"""
+    with get_session() as session:
+        return list(session.exec(
+            select(Document.id, Document.title, Document.word_count)
+        ).all())
\ No newline at end of file
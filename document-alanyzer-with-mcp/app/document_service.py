@@ -2,13 +2,16 @@
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from functools import lru_cache
+import hashlib
+import itertools
 import json
 import re
 
 from database import (
-    Document, 
-    get_document_by_id, 
-    add_document_to_db, 
+    Document,
+    get_document_by_id,
+    add_document_to_db,
     get_all_documents,
     search_documents_fts,
     get_session
@@ -20,46 +23,104 @@ from nlp import (
     extract_keywords,
     analyze_readability
 )
+from semantic_cache import search_cache
+
+# Validation limits (module-level constants - no attribute lookups in the hot path)
+MAX_TITLE_LENGTH = 200
+MAX_CONTENT_LENGTH = 1000000  # 1MB of text
+MIN_CONTENT_LENGTH = 10
+MIN_WORD_COUNT = 5
+
+_WORD_RE = re.compile(r'\S+')
+
+# Search scoring helpers (module-level pure functions so results can be cached
+# across repeated queries)
+
+@lru_cache(maxsize=1024)
+def _query_pattern(query_terms: tuple):
+    """Compile a case-insensitive alternation for the query terms once"""
+    return re.compile('|'.join(map(re.escape, query_terms)), re.IGNORECASE)
+
+# Preview memo keyed by (document id, updated_at, query terms) - only the
+# ~200-char preview strings live here, never the document bodies an
+# lru_cache on the content argument would pin. Oldest entry falls out
+# once full (insertion order is good enough for a repeat-query cache).
+_PREVIEW_CACHE: Dict[tuple, str] = {}
+_PREVIEW_CACHE_MAX = 4096
+
+def _cached_preview(doc: Document, query_terms: tuple) -> str:
+    key = (doc.id, doc.updated_at, query_terms)
+    preview = _PREVIEW_CACHE.get(key)
+    if preview is None:
+        preview = _get_content_preview(doc.content, query_terms)
+        if len(_PREVIEW_CACHE) >= _PREVIEW_CACHE_MAX:
+            del _PREVIEW_CACHE[next(iter(_PREVIEW_CACHE))]
+        _PREVIEW_CACHE[key] = preview
+    return preview
+
+def _get_content_preview(content: str, query_terms: tuple, preview_length: int = 200) -> str:
+    """Get content preview with query context"""
+    try:
+        # Single case-insensitive regex scan - no lowercase copy of the
+        # full content is allocated just to find one offset
+        match = _query_pattern(query_terms).search(content) if query_terms else None
+        first_match_pos = match.start() if match else 0
+
+        # Extract preview around the match
+        start_pos = max(0, first_match_pos - preview_length // 2)
+        end_pos = min(len(content), start_pos + preview_length)
+
+        preview = content[start_pos:end_pos]
+
+        # Add ellipsis if needed
+        if start_pos > 0:
+            preview = "..." + preview
+        if end_pos < len(content):
+            preview = preview + "..."
+
+        return preview
+
+    except:
+        return content[:preview_length] + "..." if len(content) > preview_length else content
 
 class DocumentService:
     """Service layer for document operations"""
     
-    def __init__(self):
-        self.max_title_length = 200
-        self.max_content_length = 1000000  # 1MB of text
-        self.min_content_length = 10
-    
     def validate_document_data(self, title: str, content: str, author: Optional[str] = None) -> Dict[str, Any]:
         """
         Validate document data before storing
-        
+
         Returns:
             Dict with 'valid' boolean and 'errors' list
         """
         errors = []
-        
+
         # Title validation
         if not title or not title.strip():
             errors.append("Title is required")
-        elif len(title) > self.max_title_length:
-            errors.append(f"Title too long (max {self.max_title_length} characters)")
-        
-        # Content validation
-        if not content or not content.strip():
+        elif len(title) > MAX_TITLE_LENGTH:
+            errors.append(f"Title too long (max {MAX_TITLE_LENGTH} characters)")
+
+        # Content validation (strip once and reuse)
+        stripped = content.strip() if content else ""
+        if not stripped:
             errors.append("Content is required")
-        elif len(content) < self.min_content_length:
-            errors.append(f"Content too short (min {self.min_content_length} characters)")
-        elif len(content) > self.max_content_length:
-            errors.append(f"Content too long (max {self.max_content_length} characters)")
-        
+        elif len(content) < MIN_CONTENT_LENGTH:
+            errors.append(f"Content too short (min {MIN_CONTENT_LENGTH} characters)")
+        elif len(content) > MAX_CONTENT_LENGTH:
+            errors.append(f"Content too long (max {MAX_CONTENT_LENGTH} characters)")
+
         # Author validation (optional)
         if author and len(author) > 100:
             errors.append("Author name too long (max 100 characters)")
-        
-        # Content quality check
-        if content and len(content.split()) < 5:
-            errors.append("Content must contain at least 5 words")
-        
+
+        # Content quality check - bounded scan that stops after the first
+        # few tokens instead of splitting the whole content
+        if content:
+            word_sample = sum(1 for _ in itertools.islice(_WORD_RE.finditer(content), MIN_WORD_COUNT))
+            if word_sample < MIN_WORD_COUNT:
+                errors.append(f"Content must contain at least {MIN_WORD_COUNT} words")
+
         return {
             "valid": len(errors) == 0,
             "errors": errors
@@ -97,29 +158,23 @@ class DocumentService:
             
             # Calculate basic stats
             stats = get_word_stats(content)
-            
-            # Add to database
+
+            # Add to database with stats set before the INSERT
+            # (single round-trip instead of insert + follow-up update)
             doc = add_document_to_db(
                 title=title,
                 content=content,
                 author=author,
-                source=source
+                source=source,
+                word_count=stats["word_count"],
+                sentence_count=stats["sentence_count"],
+                reading_time_minutes=stats["reading_time_minutes"]
             )
             
-            # Update with basic stats
-            with get_session() as session:
-                db_doc = session.get(Document, doc.id)
-                if db_doc:
-                    db_doc.word_count = stats["word_count"]
-                    db_doc.sentence_count = stats["sentence_count"]
-                    db_doc.reading_time_minutes = stats["reading_time_minutes"]
-                    db_doc.updated_at = datetime.now()
-                    session.commit()
-            
-            # Run analysis if requested
+            # Run analysis if requested (reuse the stats computed above)
             analysis_result = None
             if auto_analyze:
-                analysis_result = self.analyze_document(doc.id)
+                analysis_result = self.analyze_document(doc.id, precomputed_stats=stats)
             
             return {
                 "success": True,
@@ -184,14 +239,15 @@ class DocumentService:
                 "errors": [f"Database error: {str(e)}"]
             }
     
-    def search_documents(self, query: str, limit: int = 10) -> Dict[str, Any]:
+    def search_documents(self, query: str, limit: int = 10, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Search documents using full-text search
-        
+
         Args:
             query: Search query
             limit: Maximum number of results
-            
+            force_refresh: Whether to bypass the semantic cache
+
         Returns:
             Dict with search results
         """
@@ -201,18 +257,29 @@ class DocumentService:
                     "success": False,
                     "errors": ["Search query is required"]
                 }
-            
+
             # Clean query
             query = query.strip()
-            
+
+            # Serve semantically similar queries from cache
+            if not force_refresh:
+                cached = search_cache.get(query)
+                if cached and cached.get("limit") == limit:
+                    return cached["result"]
+
+            # Tokenize the query once for all results
+            query_terms = tuple(query.lower().split())
+
             # Perform FTS search
             results = search_documents_fts(query, limit)
-            
+
             documents = []
-            for doc in results:
-                # Calculate relevance score (simplified)
-                relevance_score = self._calculate_relevance(doc.content, query)
-                
+            for doc, bm25_score in results:
+                # Map bm25 (more negative = better) into [0, 1) - SQLite
+                # already ranked the results in C, no Python rescan needed
+                abs_score = abs(bm25_score)
+                relevance_score = round(abs_score / (1.0 + abs_score), 2)
+
                 documents.append({
                     "id": doc.id,
                     "title": doc.title,
@@ -222,32 +289,39 @@ class DocumentService:
                     "sentence_count": doc.sentence_count,
                     "reading_time_minutes": doc.reading_time_minutes,
                     "relevance_score": relevance_score,
-                    "content_preview": self._get_content_preview(doc.content, query),
+                    "content_preview": _cached_preview(doc, query_terms),
                     "created_at": doc.created_at.isoformat(),
                     "updated_at": doc.updated_at.isoformat()
                 })
             
-            return {
+            result = {
                 "success": True,
                 "query": query,
                 "results_count": len(documents),
                 "documents": documents
             }
-            
+
+            # Cache for future near-duplicate queries
+            search_cache.put(query, {"limit": limit, "result": result})
+
+            return result
+
         except Exception as e:
             return {
                 "success": False,
                 "errors": [f"Search error: {str(e)}"]
             }
     
-    def analyze_document(self, document_id: int, force_refresh: bool = False) -> Dict[str, Any]:
+    def analyze_document(self, document_id: int, force_refresh: bool = False,
+                        precomputed_stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Analyze a document comprehensively
-        
+
         Args:
             document_id: Document ID
             force_refresh: Whether to force new analysis (ignore cache)
-            
+            precomputed_stats: Optional word stats to avoid re-tokenizing
+
         Returns:
             Dict with analysis results
         """
@@ -273,7 +347,7 @@ class DocumentService:
                     }
             
             # Run comprehensive analysis
-            analysis = analyze_text_comprehensive(content)
+            analysis = analyze_text_comprehensive(content, precomputed_stats=precomputed_stats)
             
             # Cache the results (simplified)
             self._cache_analysis(document_id, analysis)
@@ -292,48 +366,6 @@ class DocumentService:
                 "errors": [f"Analysis error: {str(e)}"]
             }
     
-    def _calculate_relevance(self, content: str, query: str) -> float:
-        """Calculate simple relevance score"""
-        try:
-            query_terms = query.lower().split()
-            content_lower = content.lower()
-            
-            matches = sum(1 for term in query_terms if term in content_lower)
-            return round(matches / len(query_terms), 2) if query_terms else 0.0
-        except:
-            return 0.0
-    
-    def _get_content_preview(self, content: str, query: str, preview_length: int = 200) -> str:
-        """Get content preview with query context"""
-        try:
-            query_terms = query.lower().split()
-            
-            # Find first occurrence of any query term
-            content_lower = content.lower()
-            first_match_pos = len(content)
-            
-            for term in query_terms:
-                pos = content_lower.find(term)
-                if pos != -1 and pos < first_match_pos:
-                    first_match_pos = pos
-            
-            # Extract preview around the match
-            start_pos = max(0, first_match_pos - preview_length // 2)
-            end_pos = min(len(content), start_pos + preview_length)
-            
-            preview = content[start_pos:end_pos]
-            
-            # Add ellipsis if needed
-            if start_pos > 0:
-                preview = "..." + preview
-            if end_pos < len(content):
-                preview = preview + "..."
-            
-            return preview
-            
-        except:
-            return content[:preview_length] + "..." if len(content) > preview_length else content
-    
     def _get_cached_analysis(self, document_id: int) -> Optional[Dict[str, Any]]:
         """Get cached analysis (simplified implementation)"""
         try:
@@ -352,17 +384,27 @@ class DocumentService:
     def _cache_analysis(self, document_id: int, analysis: Dict[str, Any]) -> None:
         """Cache analysis results (simplified implementation)"""
         try:
+            # Stable hash over deterministic serialization - if the analysis
+            # is unchanged we skip the UPDATE and the updated_at bump
+            new_hash = hashlib.md5(
+                json.dumps(analysis, sort_keys=True, default=str).encode()
+            ).hexdigest()[:8]
+
             with get_session() as session:
                 doc = session.get(Document, document_id)
                 if doc:
+                    if doc.analysis_version == new_hash:
+                        return
+
                     # Store main analysis components as JSON
                     if "sentiment_analysis" in analysis:
-                        doc.sentiment_analysis = json.dumps(analysis["sentiment_analysis"])
+                        doc.sentiment_analysis = json.dumps(analysis["sentiment_analysis"], sort_keys=True)
                     if "keyword_analysis" in analysis:
-                        doc.keywords = json.dumps(analysis["keyword_analysis"])
+                        doc.keywords = json.dumps(analysis["keyword_analysis"], sort_keys=True)
                     if "readability_analysis" in analysis:
-                        doc.readability_scores = json.dumps(analysis["readability_analysis"])
-                    
+                        doc.readability_scores = json.dumps(analysis["readability_analysis"], sort_keys=True)
+
+                    doc.analysis_version = new_hash
                     doc.updated_at = datetime.now()
                     session.commit()
         except Exception as e:
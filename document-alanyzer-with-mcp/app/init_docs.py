@@ -1,17 +1,21 @@
 # app/init_docs.py
 
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from database import init_database, add_document_to_db, get_all_documents
+from database import init_database, add_documents_bulk, get_all_documents, list_document_summaries
+
+# Compiled once - matched against every filename
+_NUM_PREFIX_RE = re.compile(r'^\d+_')
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
 
 def extract_title_from_filename(filename: str) -> str:
     """Extract readable title from filename"""
     # Remove number prefix and extension
-    title = re.sub(r'^\d+_', '', filename)
-    title = title.replace('.txt', '')
-    title = title.replace('_', ' ')
-    return title.title()
+    title = _NUM_PREFIX_RE.sub('', Path(filename).stem)
+    return title.translate(_UNDERSCORE_TO_SPACE).title()
 
 def load_sample_documents():
     """Load all sample documents from data/sample_docs/"""
@@ -32,52 +36,71 @@ def load_sample_documents():
     
     print(f"📁 Found {len(txt_files)} documents to load...")
     
-    loaded_count = 0
-    
-    for file_path in sorted(txt_files):
+    # Read all files in parallel (file I/O releases the GIL), then insert
+    # in one transaction (one commit total)
+    paths = sorted(txt_files)
+    items = []
+
+    def read_file(file_path):
+        # mmap lets us reject whitespace-only files from a bounded
+        # prescan before decoding the whole file into a str. The prescan
+        # is only conclusive when it saw the entire file - a larger file
+        # may have real content past a whitespace preamble, so it falls
+        # through to the full decode. Exceptions are caught here, on the
+        # worker, so one unreadable or non-UTF-8 file skips itself
+        # instead of aborting the whole executor.map loop.
         try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-            
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return file_path, "", None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if size <= 4096 and not mm[:].strip():
+                        return file_path, "", None
+                    return file_path, mm[:].decode('utf-8').strip(), None
+        except Exception as e:
+            return file_path, None, e
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for file_path, content, error in executor.map(read_file, paths):
+            if error is not None:
+                print(f"❌ Error loading {file_path.name}: {error}")
+                continue
             if not content:
                 print(f"⚠️  Skipping empty file: {file_path.name}")
                 continue
-            
+
             # Extract title from filename
-            title = extract_title_from_filename(file_path.name)
-            
-            # Add to database
-            doc = add_document_to_db(
-                title=title,
-                content=content,
-                author="AI Learning Materials",  # Default author
-                source=str(file_path)
-            )
-            
-            print(f"✅ Loaded: {title} (ID: {doc.id})")
-            loaded_count += 1
-            
-        except Exception as e:
-            print(f"❌ Error loading {file_path.name}: {e}")
-    
-    print(f"\n🎉 Successfully loaded {loaded_count} documents!")
+            items.append({
+                "title": extract_title_from_filename(file_path.name),
+                "content": content,
+                "author": "AI Learning Materials",  # Default author
+                "source": str(file_path)
+            })
+
+    # Add to database in a single bulk insert
+    docs = add_documents_bulk(items) if items else []
+
+    for doc in docs:
+        print(f"✅ Loaded: {doc.title} (ID: {doc.id})")
+
+    print(f"\n🎉 Successfully loaded {len(docs)} documents!")
 
 def show_document_summary():
     """Show summary of loaded documents"""
-    docs = get_all_documents()
-    
-    if not docs:
+    # Only id/title/word_count are needed - avoid loading full content
+    summaries = list_document_summaries()
+
+    if not summaries:
         print("📭 No documents found in database")
         return
-    
+
     print(f"\n📊 Database Summary:")
-    print(f"Total documents: {len(docs)}")
+    print(f"Total documents: {len(summaries)}")
     print("\nDocuments:")
-    
-    for doc in docs:
-        word_count = len(doc.content.split()) if doc.content else 0
-        print(f"  {doc.id}: {doc.title} ({word_count} words)")
+
+    for doc_id, title, word_count in summaries:
+        print(f"  {doc_id}: {title} ({word_count if word_count is not None else 0} words)")
 
 def main():
     """Main initialization function"""
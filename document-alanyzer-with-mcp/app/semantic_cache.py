@@ -0,0 +1,98 @@
+# app/semantic_cache.py
+
+from typing import Any, Dict, Optional
+from collections import OrderedDict
+
+import numpy as np
+
+# Lazy-loaded sentence transformer (loading the model takes a few seconds,
+# so we only pay that cost on the first cached lookup)
+_embedding_model = None
+
+def _get_embedding_model():
+    """Load the embedding model on first use"""
+    global _embedding_model
+    if _embedding_model is None:
+        from sentence_transformers import SentenceTransformer
+        _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+    return _embedding_model
+
+class SemanticCache:
+    """
+    Cache that serves results for semantically similar queries.
+
+    Queries are embedded and L2-normalized; a lookup computes cosine
+    similarity against all cached embeddings in one matrix-vector product
+    and returns the stored result if the best match is above the threshold.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.92, max_size: int = 4096):
+        self.similarity_threshold = similarity_threshold
+        self.max_size = max_size
+        self._matrix: Optional[np.ndarray] = None          # (n, dim) normalized embeddings
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()  # query -> result (LRU order)
+        self._keys: list = []                              # row index -> query key
+
+    def _embed(self, query: str) -> np.ndarray:
+        """Embed and L2-normalize a query"""
+        model = _get_embedding_model()
+        emb = np.asarray(model.encode(query), dtype=np.float32)
+        norm = np.linalg.norm(emb)
+        return emb / norm if norm > 0 else emb
+
+    def get(self, query: str) -> Optional[Any]:
+        """Return the cached result for the closest query, or None on miss"""
+        try:
+            # Exact hit - no embedding needed
+            if query in self._entries:
+                self._entries.move_to_end(query)
+                return self._entries[query]
+
+            if self._matrix is None or len(self._keys) == 0:
+                return None
+
+            emb = self._embed(query)
+            similarities = self._matrix @ emb
+            best_idx = int(np.argmax(similarities))
+
+            if similarities[best_idx] >= self.similarity_threshold:
+                key = self._keys[best_idx]
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        except Exception as e:
+            print(f"Semantic cache lookup error: {e}")
+        return None
+
+    def put(self, query: str, result: Any) -> None:
+        """Store a result, evicting the least recently used entry when full"""
+        try:
+            if query in self._entries:
+                self._entries[query] = result
+                self._entries.move_to_end(query)
+                return
+
+            emb = self._embed(query)
+            if self._matrix is None:
+                self._matrix = emb.reshape(1, -1)
+            else:
+                self._matrix = np.vstack([self._matrix, emb])
+            self._keys.append(query)
+            self._entries[query] = result
+
+            # Evict LRU entries once the cache grows past max_size
+            while len(self._entries) > self.max_size:
+                oldest_key, _ = self._entries.popitem(last=False)
+                row = self._keys.index(oldest_key)
+                self._keys.pop(row)
+                self._matrix = np.delete(self._matrix, row, axis=0)
+        except Exception as e:
+            print(f"Semantic cache store error: {e}")
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._matrix = None
+        self._entries.clear()
+        self._keys.clear()
+
+# Shared cache instance for document search results
+search_cache = SemanticCache()
@@ -32,6 +32,25 @@ def health_check():
     """Health check endpoint for Docker and monitoring"""
     return {"status": "healthy", "service": "MCP Document Analyzer"}
 
+# Warm every lazy-initialized model path at startup (compiled torch
+# kernels, spaCy pipeline buffers, syllable caches, the JIT'd readability
+# kernel) so the first user request doesn't pay the cold-start cost.
+# Runs on a background thread so /health responds immediately.
+@api.on_event("startup")
+def _warm_models():
+    def warm():
+        try:
+            nlp.get_sentiment("warm up")
+            nlp.get_word_stats("Warm up sentence.")
+            nlp.analyze_readability("Warm up sentence for the readability path.")
+            nlp.extract_keywords("warm up keywords test text", limit=3)
+            print("Model warmup complete", file=sys.stderr)
+        except Exception as e:
+            print(f"Model warmup failed: {e}", file=sys.stderr)
+
+    import threading
+    threading.Thread(target=warm, daemon=True).start()
+
 # 2) Wrap that FastAPI app in FastMCP
 #    (this will auto-generate /mcp/..., /tools/..., etc. on your FastAPI instance)
 mcp = FastMCP.from_fastapi(api, name="Doc-Analyzer")  # note: from_fastapi, not the ctor
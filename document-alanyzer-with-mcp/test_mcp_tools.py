@@ -7,7 +7,7 @@ import os
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath('.'))
 
-from app.nlp import get_sentiment, extract_keywords, analyze_readability
+from app.nlp import get_sentiments, extract_keywords, analyze_readability
 from app.document_service import document_service
 from app.database import get_all_documents
 
@@ -21,8 +21,9 @@ def test_sentiment_analysis():
         "The weather is okay today, nothing special."
     ]
     
-    for text in test_texts:
-        result = get_sentiment(text)
+    # One batched forward pass for all test texts instead of one per text
+    results = get_sentiments(test_texts)
+    for text, result in zip(test_texts, results):
         print(f"  Text: '{text[:50]}...'")
         print(f"  Sentiment: {result['label']} (confidence: {result['score']})")
         print()
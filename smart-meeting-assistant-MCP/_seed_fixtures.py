@@ -0,0 +1,93 @@
+"""
+Shared seed fixtures for the seed scripts.
+
+Both seed_data.py and simple_seed.py used to build the same 8-user list
+from scratch; the models here are constructed (and Pydantic-validated)
+once at import time and shared by both scripts.
+"""
+
+from src.models import UserCreate, TimezoneEnum
+
+
+USERS: tuple = (
+    UserCreate(
+        name="John Smith",
+        email="john.smith@company.com",
+        timezone=TimezoneEnum.US_EASTERN,
+        preferences={
+            "preferred_start_time": "09:00",
+            "preferred_end_time": "17:00",
+            "max_daily_meetings": 6
+        }
+    ),
+    UserCreate(
+        name="Sarah Johnson",
+        email="sarah.johnson@company.com",
+        timezone=TimezoneEnum.US_PACIFIC,
+        preferences={
+            "preferred_start_time": "08:30",
+            "preferred_end_time": "16:30",
+            "max_daily_meetings": 8
+        }
+    ),
+    UserCreate(
+        name="David Wilson",
+        email="david.wilson@company.com",
+        timezone=TimezoneEnum.US_CENTRAL,
+        preferences={
+            "preferred_start_time": "09:30",
+            "preferred_end_time": "17:30",
+            "max_daily_meetings": 7
+        }
+    ),
+    UserCreate(
+        name="Emma Davis",
+        email="emma.davis@company.com",
+        timezone=TimezoneEnum.EUROPE_LONDON,
+        preferences={
+            "preferred_start_time": "09:00",
+            "preferred_end_time": "17:00",
+            "max_daily_meetings": 5
+        }
+    ),
+    UserCreate(
+        name="Michael Brown",
+        email="michael.brown@company.com",
+        timezone=TimezoneEnum.EUROPE_PARIS,
+        preferences={
+            "preferred_start_time": "10:00",
+            "preferred_end_time": "18:00",
+            "max_daily_meetings": 6
+        }
+    ),
+    UserCreate(
+        name="Lisa Garcia",
+        email="lisa.garcia@company.com",
+        timezone=TimezoneEnum.ASIA_TOKYO,
+        preferences={
+            "preferred_start_time": "09:00",
+            "preferred_end_time": "17:00",
+            "max_daily_meetings": 4
+        }
+    ),
+    UserCreate(
+        name="Robert Martinez",
+        email="robert.martinez@company.com",
+        timezone=TimezoneEnum.US_MOUNTAIN,
+        preferences={
+            "preferred_start_time": "08:00",
+            "preferred_end_time": "16:00",
+            "max_daily_meetings": 7
+        }
+    ),
+    UserCreate(
+        name="Anna Chen",
+        email="anna.chen@company.com",
+        timezone=TimezoneEnum.ASIA_SHANGHAI,
+        preferences={
+            "preferred_start_time": "09:30",
+            "preferred_end_time": "17:30",
+            "max_daily_meetings": 5
+        }
+    ),
+)
@@ -4,124 +4,66 @@ Seed Data Generator for Smart Meeting Assistant
 This script generates sample users and meetings for testing and development.
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List
 
+from pydantic import TypeAdapter
+
 from src.database import UserService, MeetingService, init_database, reset_database
 from src.models import UserCreate, MeetingCreate, TimezoneEnum, MeetingType
+from _seed_fixtures import USERS
+
+# (days, hours, minutes) offsets from today's midnight, hoisted to module
+# level so building the meeting rows needs one datetime.now() plus a
+# timedelta add per row instead of chained .replace() allocations
+_MEETING_OFFSETS = (
+    (0, 9, 0),    # Team Standup
+    (0, 10, 30),  # Project Planning Session
+    (0, 14, 0),   # 1:1 with Manager
+    (0, 15, 30),  # Client Demo
+    (1, 10, 0),   # All Hands Meeting
+    (1, 12, 0),   # Design Review
+    (2, 11, 0),   # Brainstorming Session
+    (2, 14, 0),   # Technical Interview
+    (3, 10, 0),   # Weekly Team Sync
+    (4, 11, 0),   # Sprint Retrospective
+)
+_CONFLICT_OFFSETS = (
+    (0, 9, 15),   # Overlapping Meeting
+    (0, 10, 0),   # Back-to-Back Meeting
+)
+
+# Compiled once at import - validates a whole row list in one C-level
+# call instead of re-entering Pydantic per row
+_MEETING_ADAPTER = TypeAdapter(List[MeetingCreate])
 
 
 def create_sample_users() -> List[str]:
     """Create sample users across different timezones"""
-    users_data = [
-        {
-            "name": "John Smith",
-            "email": "john.smith@company.com",
-            "timezone": TimezoneEnum.US_EASTERN,
-            "preferences": {
-                "preferred_start_time": "09:00",
-                "preferred_end_time": "17:00",
-                "max_daily_meetings": 6
-            }
-        },
-        {
-            "name": "Sarah Johnson",
-            "email": "sarah.johnson@company.com", 
-            "timezone": TimezoneEnum.US_PACIFIC,
-            "preferences": {
-                "preferred_start_time": "08:30",
-                "preferred_end_time": "16:30",
-                "max_daily_meetings": 8
-            }
-        },
-        {
-            "name": "David Wilson",
-            "email": "david.wilson@company.com",
-            "timezone": TimezoneEnum.US_CENTRAL,
-            "preferences": {
-                "preferred_start_time": "09:30",
-                "preferred_end_time": "17:30",
-                "max_daily_meetings": 7
-            }
-        },
-        {
-            "name": "Emma Davis",
-            "email": "emma.davis@company.com",
-            "timezone": TimezoneEnum.EUROPE_LONDON,
-            "preferences": {
-                "preferred_start_time": "09:00",
-                "preferred_end_time": "17:00",
-                "max_daily_meetings": 5
-            }
-        },
-        {
-            "name": "Michael Brown",
-            "email": "michael.brown@company.com",
-            "timezone": TimezoneEnum.EUROPE_PARIS,
-            "preferences": {
-                "preferred_start_time": "10:00",
-                "preferred_end_time": "18:00",
-                "max_daily_meetings": 6
-            }
-        },
-        {
-            "name": "Lisa Garcia",
-            "email": "lisa.garcia@company.com",
-            "timezone": TimezoneEnum.ASIA_TOKYO,
-            "preferences": {
-                "preferred_start_time": "09:00",
-                "preferred_end_time": "17:00",
-                "max_daily_meetings": 4
-            }
-        },
-        {
-            "name": "Robert Martinez",
-            "email": "robert.martinez@company.com",
-            "timezone": TimezoneEnum.US_MOUNTAIN,
-            "preferences": {
-                "preferred_start_time": "08:00",
-                "preferred_end_time": "16:00",
-                "max_daily_meetings": 7
-            }
-        },
-        {
-            "name": "Anna Chen",
-            "email": "anna.chen@company.com",
-            "timezone": TimezoneEnum.ASIA_SHANGHAI,
-            "preferences": {
-                "preferred_start_time": "09:30",
-                "preferred_end_time": "17:30",
-                "max_daily_meetings": 5
-            }
-        }
-    ]
-    
-    user_ids = []
     print("Creating sample users...")
-    
-    for user_data in users_data:
-        try:
-            # Try to create user - if it fails due to duplicate email, we'll handle it
-            user_create = UserCreate(**user_data)
-            user = UserService.create_user(user_create)
-            user_ids.append(user.id)
-            print(f"  ✅ Created user: {user.name} ({user.email}) - {user.timezone}")
-        except Exception as e:
-            # If creation fails (likely due to duplicate email), try to find existing user
-            if "UNIQUE constraint failed" in str(e):
-                try:
-                    existing_user = UserService.get_user_by_email(user_data["email"])
-                    if existing_user:
-                        user_ids.append(existing_user.id)
-                        print(f"  ♻️  User already exists: {user_data['name']} ({user_data['email']})")
-                    else:
-                        print(f"  ❌ Failed to create or find user {user_data['email']}")
-                except Exception as find_error:
-                    print(f"  ❌ Failed to create user {user_data['email']}: {find_error}")
-            else:
-                print(f"  ❌ Failed to create user {user_data['email']}: {e}")
-            continue
-    
+
+    # SELECT the already-seeded emails up front, then INSERT only the
+    # missing users in one batch - two queries total instead of an
+    # attempted INSERT (and exception-message sniffing) per duplicate
+    existing = UserService.get_ids_by_emails([user_create.email for user_create in USERS])
+    missing = [user_create for user_create in USERS if user_create.email not in existing]
+    new_ids = UserService.bulk_create_users(missing) if missing else []
+    new_by_email = dict(zip((user_create.email for user_create in missing), new_ids))
+
+    user_ids = []
+    lines = []
+    for user_create in USERS:
+        if user_create.email in existing:
+            user_ids.append(existing[user_create.email])
+            lines.append(f"  ♻️  User already exists: {user_create.name} ({user_create.email})")
+        else:
+            user_ids.append(new_by_email[user_create.email])
+            lines.append(f"  ✅ Created user: {user_create.name} ({user_create.email}) - {user_create.timezone}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     return user_ids
 
 
@@ -130,13 +72,14 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
     meeting_ids = []
     
     # Base date - start from today
-    base_date = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
-    
+    midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    ts = [midnight + timedelta(days=d, hours=h, minutes=m) for d, h, m in _MEETING_OFFSETS]
+
     meetings_data = [
         {
             "title": "Team Standup",
             "description": "Daily team standup meeting",
-            "start_time": base_date,
+            "start_time": ts[0],
             "duration_minutes": 30,
             "participants": user_ids[:4],
             "meeting_type": MeetingType.STANDUP,
@@ -145,7 +88,7 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "Project Planning Session",
             "description": "Q1 project planning and roadmap discussion",
-            "start_time": base_date.replace(hour=10, minute=30),
+            "start_time": ts[1],
             "duration_minutes": 90,
             "participants": user_ids[:6],
             "meeting_type": MeetingType.TEAM_MEETING,
@@ -154,7 +97,7 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "1:1 with Manager",
             "description": "Weekly one-on-one meeting",
-            "start_time": base_date.replace(hour=14, minute=0),
+            "start_time": ts[2],
             "duration_minutes": 60,
             "participants": [user_ids[0], user_ids[1]],
             "meeting_type": MeetingType.ONE_ON_ONE,
@@ -163,7 +106,7 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "Client Demo",
             "description": "Product demonstration for key client",
-            "start_time": base_date.replace(hour=15, minute=30),
+            "start_time": ts[3],
             "duration_minutes": 45,
             "participants": user_ids[:3],
             "meeting_type": MeetingType.CLIENT_CALL,
@@ -172,7 +115,7 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "All Hands Meeting",
             "description": "Monthly company all-hands meeting",
-            "start_time": base_date + timedelta(days=1, hours=1),
+            "start_time": ts[4],
             "duration_minutes": 60,
             "participants": user_ids,
             "meeting_type": MeetingType.ALL_HANDS,
@@ -181,7 +124,7 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "Design Review",
             "description": "Review of new feature designs",
-            "start_time": base_date + timedelta(days=1, hours=3),
+            "start_time": ts[5],
             "duration_minutes": 120,
             "participants": user_ids[2:6],
             "meeting_type": MeetingType.REVIEW,
@@ -190,7 +133,7 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "Brainstorming Session",
             "description": "Creative brainstorming for marketing campaign",
-            "start_time": base_date + timedelta(days=2, hours=2),
+            "start_time": ts[6],
             "duration_minutes": 90,
             "participants": user_ids[1:5],
             "meeting_type": MeetingType.BRAINSTORM,
@@ -199,7 +142,7 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "Technical Interview",
             "description": "Senior developer interview",
-            "start_time": base_date + timedelta(days=2, hours=5),
+            "start_time": ts[7],
             "duration_minutes": 60,
             "participants": user_ids[0:3],
             "meeting_type": MeetingType.INTERVIEW,
@@ -208,7 +151,7 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "Weekly Team Sync",
             "description": "Weekly team synchronization meeting",
-            "start_time": base_date + timedelta(days=3, hours=1),
+            "start_time": ts[8],
             "duration_minutes": 45,
             "participants": user_ids[:5],
             "meeting_type": MeetingType.TEAM_MEETING,
@@ -217,7 +160,7 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "Sprint Retrospective",
             "description": "Sprint retrospective and planning",
-            "start_time": base_date + timedelta(days=4, hours=2),
+            "start_time": ts[9],
             "duration_minutes": 90,
             "participants": user_ids[1:7],
             "meeting_type": MeetingType.REVIEW,
@@ -226,23 +169,29 @@ def create_sample_meetings(user_ids: List[str]) -> List[str]:
     ]
     
     print("\nCreating sample meetings...")
-    
-    for meeting_data in meetings_data:
-        try:
-            # Use the first participant as the organizer
-            organizer_id = meeting_data["participants"][0]
-            
-            meeting_create = MeetingCreate(**meeting_data)
-            meeting = MeetingService.create_meeting(meeting_create, organizer_id)
-            meeting_ids.append(meeting.id)
-            
-            print(f"  ✅ Created meeting: {meeting.title}")
-            print(f"     📅 {meeting.start_time.strftime('%Y-%m-%d %H:%M')} - {meeting.duration_minutes} mins")
-            print(f"     👥 {len(meeting.participants)} participants")
-        except Exception as e:
-            print(f"  ❌ Failed to create meeting '{meeting_data['title']}': {e}")
-            continue
-    
+
+    try:
+        # One bulk call: every row shares a single transaction and the
+        # pre-assigned IDs let SQLAlchemy batch the INSERT with executemany
+        # (first participant acts as organizer)
+        validated = _MEETING_ADAPTER.validate_python(meetings_data)
+        items = [
+            (meeting_create, meeting_create.participants[0])
+            for meeting_create in validated
+        ]
+        meeting_ids = MeetingService.bulk_create_meetings(items)
+
+        # Progress output after the hot path, written in one flush
+        lines = []
+        for meeting_data in meetings_data:
+            lines.append(f"  ✅ Created meeting: {meeting_data['title']}")
+            lines.append(f"     📅 {meeting_data['start_time'].strftime('%Y-%m-%d %H:%M')} - {meeting_data['duration_minutes']} mins")
+            lines.append(f"     👥 {len(meeting_data['participants'])} participants")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    except Exception as e:
+        print(f"  ❌ Failed to create meetings: {e}")
+
     return meeting_ids
 
 
@@ -251,13 +200,14 @@ def create_conflicting_meetings(user_ids: List[str]) -> List[str]:
     meeting_ids = []
     
     # Create meetings that will conflict with existing ones
-    base_date = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    conflict_ts = [midnight + timedelta(days=d, hours=h, minutes=m) for d, h, m in _CONFLICT_OFFSETS]
     
     conflicting_meetings = [
         {
             "title": "Overlapping Meeting",
             "description": "This meeting overlaps with Team Standup",
-            "start_time": base_date.replace(minute=15),  # Overlaps with standup
+            "start_time": conflict_ts[0],  # Overlaps with standup
             "duration_minutes": 30,
             "participants": [user_ids[0], user_ids[2]],
             "meeting_type": MeetingType.TEAM_MEETING
@@ -265,7 +215,7 @@ def create_conflicting_meetings(user_ids: List[str]) -> List[str]:
         {
             "title": "Back-to-Back Meeting",
             "description": "Meeting right after another one",
-            "start_time": base_date.replace(hour=10, minute=0),  # Right after standup
+            "start_time": conflict_ts[1],  # Right after standup
             "duration_minutes": 45,
             "participants": [user_ids[1], user_ids[3]],
             "meeting_type": MeetingType.ONE_ON_ONE
@@ -273,43 +223,52 @@ def create_conflicting_meetings(user_ids: List[str]) -> List[str]:
     ]
     
     print("\nCreating conflicting meetings for testing...")
-    
-    for meeting_data in conflicting_meetings:
-        organizer_id = meeting_data["participants"][0]
-        meeting_create = MeetingCreate(**meeting_data)
-        meeting = MeetingService.create_meeting(meeting_create, organizer_id)
-        meeting_ids.append(meeting.id)
-        print(f"  ⚠️  Created conflicting meeting: {meeting.title}")
-    
+
+    items = [
+        (meeting_create, meeting_create.participants[0])
+        for meeting_create in _MEETING_ADAPTER.validate_python(conflicting_meetings)
+    ]
+    meeting_ids = MeetingService.bulk_create_meetings(items)
+    sys.stdout.write("".join(
+        f"  ⚠️  Created conflicting meeting: {meeting_data['title']}\n"
+        for meeting_data in conflicting_meetings
+    ))
+    sys.stdout.flush()
+
     return meeting_ids
 
 
 def test_database_operations(user_ids: List[str], meeting_ids: List[str]):
     """Test various database operations"""
     print("\n🧪 Testing Database Operations...")
-    
-    # Test user retrieval
-    user = UserService.get_user_by_id(user_ids[0])
+
+    start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    end_date = start_date + timedelta(days=7)
+
+    # The four reads are independent - dispatch them together and print
+    # in fixed order once all have returned
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        user_future = executor.submit(UserService.get_user_by_id, user_ids[0])
+        meeting_future = executor.submit(MeetingService.get_meeting_by_id, meeting_ids[0])
+        user_meetings_future = executor.submit(MeetingService.get_meetings_by_user, user_ids[0])
+        range_future = executor.submit(MeetingService.get_meetings_in_range, start_date, end_date)
+
+        user = user_future.result()
+        meeting = meeting_future.result()
+        user_meetings = user_meetings_future.result()
+        range_meetings = range_future.result()
+
     if user:
         print(f"✅ Retrieved user: {user.name} ({user.email})")
     else:
         print("❌ Failed to retrieve user")
-    
-    # Test meeting retrieval
-    meeting = MeetingService.get_meeting_by_id(meeting_ids[0])
+
     if meeting:
         print(f"✅ Retrieved meeting: {meeting.title}")
     else:
         print("❌ Failed to retrieve meeting")
-    
-    # Test user meetings retrieval
-    user_meetings = MeetingService.get_meetings_by_user(user_ids[0])
+
     print(f"✅ User has {len(user_meetings)} meetings")
-    
-    # Test date range query
-    start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    end_date = start_date + timedelta(days=7)
-    range_meetings = MeetingService.get_meetings_in_range(start_date, end_date)
     print(f"✅ Found {len(range_meetings)} meetings in next 7 days")
     
     # Test database health
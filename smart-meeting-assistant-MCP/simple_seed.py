@@ -4,11 +4,33 @@ Simple Seed Data Generator for Smart Meeting Assistant
 This is a simplified version that reliably creates sample data for testing.
 """
 
+import sys
 from datetime import datetime, timedelta
 
 from src.database import reset_database, init_database, check_database_health
 from src.database import UserService, MeetingService
-from src.models import UserCreate, MeetingCreate, TimezoneEnum, MeetingType
+from src.models import MeetingCreate, MeetingType
+from _seed_fixtures import USERS
+
+# (days, hours, minutes) offsets from today's midnight - built once at
+# import so the seed run does a single datetime.now() plus one timedelta
+# add per meeting instead of chained .replace() allocations
+_MEETING_OFFSETS = (
+    (0, 9, 0),    # Team Standup
+    (0, 10, 30),  # Project Planning
+    (0, 14, 0),   # 1:1 with Manager
+    (0, 15, 30),  # Client Demo
+    (1, 10, 0),   # All Hands
+    (1, 12, 0),   # Design Review
+    (2, 11, 0),   # Brainstorming
+    (2, 14, 0),   # Interview
+    (3, 10, 0),   # Team Sync
+    (4, 11, 0),   # Retrospective
+)
+_CONFLICT_OFFSETS = (
+    (0, 9, 15),   # Overlapping Meeting
+    (0, 10, 0),   # Back-to-Back Meeting
+)
 
 
 def create_seed_data():
@@ -21,86 +43,87 @@ def create_seed_data():
     reset_database()
     print("✅ Database reset complete!")
     
-    # Create users
+    # Create users from the shared pre-validated fixtures, inserted as
+    # one batch in a single transaction
     print("\nCreating sample users...")
-    users_data = [
-        ("John Smith", "john.smith@company.com", TimezoneEnum.US_EASTERN),
-        ("Sarah Johnson", "sarah.johnson@company.com", TimezoneEnum.US_PACIFIC),
-        ("David Wilson", "david.wilson@company.com", TimezoneEnum.US_CENTRAL),
-        ("Emma Davis", "emma.davis@company.com", TimezoneEnum.EUROPE_LONDON),
-        ("Michael Brown", "michael.brown@company.com", TimezoneEnum.EUROPE_PARIS),
-        ("Lisa Garcia", "lisa.garcia@company.com", TimezoneEnum.ASIA_TOKYO),
-        ("Robert Martinez", "robert.martinez@company.com", TimezoneEnum.US_MOUNTAIN),
-        ("Anna Chen", "anna.chen@company.com", TimezoneEnum.ASIA_SHANGHAI),
-    ]
-    
-    user_ids = []
-    for name, email, timezone in users_data:
-        user_create = UserCreate(
-            name=name,
-            email=email,
-            timezone=timezone,
-            preferences={
-                "preferred_start_time": "09:00",
-                "preferred_end_time": "17:00",
-                "max_daily_meetings": 6
-            }
-        )
-        user_id = UserService.create_user(user_create)
-        user_ids.append(user_id)
-        print(f"  ✅ Created: {name} ({timezone})")
+    # Tuple instead of list - immutable after creation, and the
+    # participant slices below copy pointers at C level rather than
+    # building fresh Python lists
+    user_ids = tuple(UserService.bulk_create_users(list(USERS)))
+    # One buffered write instead of a stdout syscall per row
+    sys.stdout.write("".join(
+        f"  ✅ Created: {user_create.name} ({user_create.timezone})\n"
+        for user_create in USERS
+    ))
     
     # Create meetings
     print(f"\nCreating sample meetings...")
-    base_date = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
-    
+    midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    ts = [midnight + timedelta(days=d, hours=h, minutes=m) for d, h, m in _MEETING_OFFSETS]
+
     meetings_data = [
-        ("Team Standup", base_date, 30, user_ids[:4], MeetingType.STANDUP),
-        ("Project Planning", base_date.replace(hour=10, minute=30), 90, user_ids[:6], MeetingType.TEAM_MEETING),
-        ("1:1 with Manager", base_date.replace(hour=14), 60, user_ids[:2], MeetingType.ONE_ON_ONE),
-        ("Client Demo", base_date.replace(hour=15, minute=30), 45, user_ids[:3], MeetingType.CLIENT_CALL),
-        ("All Hands", base_date + timedelta(days=1, hours=1), 60, user_ids, MeetingType.ALL_HANDS),
-        ("Design Review", base_date + timedelta(days=1, hours=3), 120, user_ids[2:6], MeetingType.REVIEW),
-        ("Brainstorming", base_date + timedelta(days=2, hours=2), 90, user_ids[1:5], MeetingType.BRAINSTORM),
-        ("Interview", base_date + timedelta(days=2, hours=5), 60, user_ids[:3], MeetingType.INTERVIEW),
-        ("Team Sync", base_date + timedelta(days=3, hours=1), 45, user_ids[:5], MeetingType.TEAM_MEETING),
-        ("Retrospective", base_date + timedelta(days=4, hours=2), 90, user_ids[1:7], MeetingType.REVIEW),
+        ("Team Standup", ts[0], 30, user_ids[:4], MeetingType.STANDUP),
+        ("Project Planning", ts[1], 90, user_ids[:6], MeetingType.TEAM_MEETING),
+        ("1:1 with Manager", ts[2], 60, user_ids[:2], MeetingType.ONE_ON_ONE),
+        ("Client Demo", ts[3], 45, user_ids[:3], MeetingType.CLIENT_CALL),
+        ("All Hands", ts[4], 60, user_ids, MeetingType.ALL_HANDS),
+        ("Design Review", ts[5], 120, user_ids[2:6], MeetingType.REVIEW),
+        ("Brainstorming", ts[6], 90, user_ids[1:5], MeetingType.BRAINSTORM),
+        ("Interview", ts[7], 60, user_ids[:3], MeetingType.INTERVIEW),
+        ("Team Sync", ts[8], 45, user_ids[:5], MeetingType.TEAM_MEETING),
+        ("Retrospective", ts[9], 90, user_ids[1:7], MeetingType.REVIEW),
     ]
     
-    meeting_ids = []
-    for title, start_time, duration, participants, meeting_type in meetings_data:
-        meeting_create = MeetingCreate(
-            title=title,
-            description=f"Sample meeting: {title}",
-            start_time=start_time,
-            duration_minutes=duration,
-            participants=participants,
-            meeting_type=meeting_type
+    # Same batching for meetings - one bulk INSERT instead of a commit per row
+    meeting_items = [
+        (
+            MeetingCreate(
+                title=title,
+                description=f"Sample meeting: {title}",
+                start_time=start_time,
+                duration_minutes=duration,
+                participants=participants,
+                meeting_type=meeting_type
+            ),
+            participants[0]
         )
-        meeting_id = MeetingService.create_meeting(meeting_create, participants[0])
-        meeting_ids.append(meeting_id)
-        print(f"  ✅ Created: {title} ({duration} mins, {len(participants)} participants)")
+        for title, start_time, duration, participants, meeting_type in meetings_data
+    ]
+    meeting_ids = MeetingService.bulk_create_meetings(meeting_items)
+    sys.stdout.write("".join(
+        f"  ✅ Created: {title} ({duration} mins, {len(participants)} participants)\n"
+        for title, _, duration, participants, _ in meetings_data
+    ))
     
     # Create some conflicts for testing
     print(f"\nCreating conflicting meetings for testing...")
     
+    conflict_ts = [midnight + timedelta(days=d, hours=h, minutes=m) for d, h, m in _CONFLICT_OFFSETS]
     conflict_meetings = [
-        ("Overlapping Meeting", base_date.replace(minute=15), 30, user_ids[:2]),
-        ("Back-to-Back Meeting", base_date.replace(hour=10), 45, user_ids[2:4]),
+        ("Overlapping Meeting", conflict_ts[0], 30, user_ids[:2]),
+        ("Back-to-Back Meeting", conflict_ts[1], 45, user_ids[2:4]),
     ]
     
-    for title, start_time, duration, participants in conflict_meetings:
-        meeting_create = MeetingCreate(
-            title=title,
-            description=f"Conflicting meeting: {title}",
-            start_time=start_time,
-            duration_minutes=duration,
-            participants=participants,
-            meeting_type=MeetingType.TEAM_MEETING
+    conflict_items = [
+        (
+            MeetingCreate(
+                title=title,
+                description=f"Conflicting meeting: {title}",
+                start_time=start_time,
+                duration_minutes=duration,
+                participants=participants,
+                meeting_type=MeetingType.TEAM_MEETING
+            ),
+            participants[0]
         )
-        meeting_id = MeetingService.create_meeting(meeting_create, participants[0])
-        meeting_ids.append(meeting_id)
-        print(f"  ⚠️  Created conflict: {title}")
+        for title, start_time, duration, participants in conflict_meetings
+    ]
+    meeting_ids.extend(MeetingService.bulk_create_meetings(conflict_items))
+    sys.stdout.write("".join(
+        f"  ⚠️  Created conflict: {title}\n"
+        for title, _, _, _ in conflict_meetings
+    ))
+    sys.stdout.flush()
     
     # Final summary
     print(f"\n🎉 Seed data creation complete!")
@@ -6,14 +6,36 @@ CRUD operations for all models. Uses SQLModel for type-safe database operations.
 """
 
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from collections import defaultdict
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from uuid import uuid4
+
+
+def _new_id(prefix: str) -> str:
+    """Collision-safe sortless ID - no strftime formatting on the hot
+    path and no same-microsecond collisions under concurrent calls"""
+    return f"{prefix}_{uuid4().hex}"
+
 
 from sqlmodel import SQLModel, create_engine, Session, select
-from sqlalchemy import event
+from sqlalchemy import event, func, lambda_stmt, or_, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from .models import (
+    User, Meeting, MeetingInsight, MeetingParticipant,
+    UserCreate, MeetingCreate, MeetingStatus
+)
 
-from .models import User, Meeting, MeetingInsight, UserCreate, MeetingCreate, MeetingStatus
+
+# Request-scoped session holder: the MCP tool wrapper opens one session
+# and every nested service call joins it instead of checking out (and
+# committing/closing) its own connection per method
+_current_session: ContextVar[Optional[Session]] = ContextVar("_current_session", default=None)
 
 
 class DatabaseManager:
@@ -21,32 +43,101 @@ class DatabaseManager:
     
     def __init__(self, database_url: str = "sqlite:///./meetings.db"):
         self.database_url = database_url
+        self._tables_created = False
         self.engine = create_engine(
             database_url,
             echo=False,  # Set to True for SQL query logging
-            connect_args={"check_same_thread": False}  # Needed for SQLite
+            connect_args={"check_same_thread": False},  # Needed for SQLite
+            # Persistent pool - connections are reused across tool calls
+            # instead of being opened and torn down per service method
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=3600
+        )
+
+        # Session factory built once; sessions come out pre-configured and
+        # results stay usable after commit
+        self.session_factory = sessionmaker(
+            bind=self.engine, class_=Session, expire_on_commit=False
         )
-        
-        # Enable foreign key constraints for SQLite
+
+        # Enable foreign key constraints and performance pragmas for SQLite:
+        # WAL + synchronous=NORMAL cut fsyncs from one per statement to one
+        # per checkpoint, mmap serves reads from the page cache, and the
+        # larger cache keeps the working set in memory
         @event.listens_for(self.engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             if 'sqlite' in database_url.lower():
                 cursor = dbapi_connection.cursor()
                 cursor.execute("PRAGMA foreign_keys=ON")
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA mmap_size=268435456")
+                cursor.execute("PRAGMA cache_size=-65536")
+                cursor.execute("PRAGMA temp_store=MEMORY")
                 cursor.close()
     
     def create_tables(self):
-        """Create all database tables"""
+        """Create all database tables (no-op after the first call)"""
+        # Repeat calls (module re-imports, seed scripts after main) skip
+        # the CREATE TABLE IF NOT EXISTS round-trips entirely
+        if self._tables_created:
+            return
         SQLModel.metadata.create_all(self.engine)
-    
+        if 'sqlite' in self.database_url.lower():
+            self._migrate_duration_column()
+        self._tables_created = True
+
+    def _migrate_duration_column(self):
+        """Convert a legacy plain duration_minutes column to generated.
+
+        create_all never alters an existing meetings.db, so a database
+        created before duration became a generated column keeps the
+        plain column - nothing writes it anymore and reads would see
+        NULL. Detect that case (hidden == 0 in table_xinfo means a
+        stored, non-generated column) and swap it for a generated one.
+        ALTER TABLE can only ADD a VIRTUAL generated column, which reads
+        identically to the STORED one fresh tables get.
+        """
+        with self.engine.connect() as conn:
+            rows = conn.exec_driver_sql(
+                "SELECT name, hidden FROM pragma_table_xinfo('meeting')"
+            ).fetchall()
+            legacy = any(name == 'duration_minutes' and hidden == 0
+                         for name, hidden in rows)
+            if not legacy:
+                return
+            conn.exec_driver_sql("ALTER TABLE meeting DROP COLUMN duration_minutes")
+            conn.exec_driver_sql(
+                "ALTER TABLE meeting ADD COLUMN duration_minutes INTEGER "
+                "GENERATED ALWAYS AS "
+                "(CAST(ROUND((julianday(end_time) - julianday(start_time)) * 1440) AS INTEGER)) "
+                "VIRTUAL"
+            )
+            conn.commit()
+
     def drop_tables(self):
         """Drop all database tables (for testing/reset)"""
         SQLModel.metadata.drop_all(self.engine)
+        self._tables_created = False
     
     @contextmanager
     def get_session(self):
-        """Context manager for database sessions"""
-        session = Session(self.engine)
+        """Context manager for database sessions.
+
+        If a session is already active in this context (an outer tool
+        wrapper opened one), it is reused so all nested service calls
+        share a single connection checkout and transaction; the owner
+        commits and closes. Otherwise a fresh session is created.
+        """
+        existing = _current_session.get()
+        if existing is not None:
+            yield existing
+            return
+        session = self.session_factory()
+        token = _current_session.set(session)
         try:
             yield session
             session.commit()
@@ -54,6 +145,7 @@ class DatabaseManager:
             session.rollback()
             raise
         finally:
+            _current_session.reset(token)
             session.close()
 
 
@@ -61,6 +153,18 @@ class DatabaseManager:
 db_manager = DatabaseManager()
 
 
+@lru_cache(maxsize=512)
+def _resolve_user_id_by_email(email: str) -> Optional[str]:
+    """Resolve an email to a user ID, cached for repeat organizers.
+
+    Returns just the id string so there are no detached-instance
+    concerns; cleared whenever the user table changes.
+    """
+    with db_manager.get_session() as session:
+        statement = select(User.id).where(User.email == email)
+        return session.exec(statement).first()
+
+
 # User CRUD Operations
 class UserService:
     """Service for user-related database operations"""
@@ -70,7 +174,7 @@ class UserService:
         """Create a new user and return the user ID"""
         with db_manager.get_session() as session:
             # Generate unique ID
-            user_id = f"user_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+            user_id = _new_id("user")
             
             user = User(
                 id=user_id,
@@ -82,76 +186,197 @@ class UserService:
             
             session.add(user)
             session.commit()
+            _resolve_user_id_by_email.cache_clear()
             # Return just the ID to avoid detached instance issues
             return user_id
     
+    @staticmethod
+    def bulk_create_users(users_data: List[UserCreate]) -> List[str]:
+        """Create multiple users in one transaction and return their IDs.
+
+        One session and one commit for the whole batch instead of an
+        INSERT + fsync per user.
+        """
+        with db_manager.get_session() as session:
+            # One timestamp for the whole batch instead of a
+            # datetime.now() per row via the created_at default factory
+            now = datetime.now()
+            users = []
+            user_ids = []
+            for user_data in users_data:
+                user_id = _new_id("user")
+                user_ids.append(user_id)
+                users.append(User(
+                    id=user_id,
+                    name=user_data.name,
+                    email=user_data.email,
+                    timezone=user_data.timezone,
+                    preferences=user_data.preferences,
+                    created_at=now
+                ))
+            session.add_all(users)
+            session.commit()
+            _resolve_user_id_by_email.cache_clear()
+            # Return the generated IDs to avoid detached instance issues
+            return user_ids
+
     @staticmethod
     def get_user_by_id(user_id: str) -> Optional[User]:
         """Get user by ID"""
         with db_manager.get_session() as session:
             return session.get(User, user_id)
     
+    @staticmethod
+    def get_user_id_by_email(email: str) -> Optional[str]:
+        """Get just a user's ID by email - scalar projection, no ORM row
+        or preferences-JSON hydration"""
+        return _resolve_user_id_by_email(email)
+
+    @staticmethod
+    def get_ids_by_emails(emails: List[str]) -> Dict[str, str]:
+        """Map existing emails to user IDs in a single query"""
+        with db_manager.get_session() as session:
+            statement = select(User.email, User.id).where(User.email.in_(emails))
+            return dict(session.exec(statement).all())
+
     @staticmethod
     def get_user_by_email(email: str) -> Optional[User]:
         """Get user by email"""
         with db_manager.get_session() as session:
-            statement = select(User).where(User.email == email)
-            user = session.exec(statement).first()
-            if user:
-                # Refresh to ensure all attributes are loaded
-                session.refresh(user)
-            return user
+            statement = lambda_stmt(lambda: select(User).where(User.email == email))
+            # No refresh needed - attributes are fully loaded by the
+            # select and the factory sets expire_on_commit=False, so the
+            # instance stays readable after the session closes
+            return session.execute(statement).scalars().first()
     
     @staticmethod
-    def get_all_users() -> List[User]:
-        """Get all users"""
+    def iter_all_users(chunk_size: int = 500):
+        """Stream active users in server-side chunks.
+
+        yield_per keeps peak memory flat for large tables; the session
+        stays open until the generator is exhausted or closed.
+        """
         with db_manager.get_session() as session:
             statement = select(User).where(User.is_active == True)
-            return session.exec(statement).all()
+            result = session.execute(
+                statement.execution_options(yield_per=chunk_size)
+            ).scalars()
+            for user in result:
+                yield user
+
+    @staticmethod
+    def get_all_users() -> List[User]:
+        """Get all users (callers needing len()/indexing keep a list)"""
+        return list(UserService.iter_all_users())
     
     @staticmethod
-    def update_user_preferences(user_id: str, preferences: Dict[str, Any]) -> Optional[User]:
-        """Update user preferences"""
+    def count_users() -> int:
+        """Count users with SQL COUNT - no ORM rows are materialized"""
         with db_manager.get_session() as session:
-            user = session.get(User, user_id)
-            if user:
-                user.preferences = preferences
-                user.updated_at = datetime.now()
-                session.add(user)
-                session.commit()
-                session.refresh(user)
-            return user
-    
+            return session.exec(select(func.count()).select_from(User)).one()
+
+    @staticmethod
+    def update_user_preferences(user_id: str, preferences: Dict[str, Any]) -> bool:
+        """Update user preferences.
+
+        Single UPDATE statement - no SELECT, no ORM hydration, no
+        refresh. Callers that need the full row use get_user_by_id.
+        """
+        with db_manager.get_session() as session:
+            result = session.exec(
+                update(User)
+                .where(User.id == user_id)
+                .values(preferences=preferences, updated_at=datetime.now())
+            )
+            session.commit()
+            return result.rowcount > 0
+
     @staticmethod
     def deactivate_user(user_id: str) -> bool:
-        """Deactivate user (soft delete)"""
+        """Deactivate user (soft delete) with a single UPDATE"""
         with db_manager.get_session() as session:
-            user = session.get(User, user_id)
-            if user:
-                user.is_active = False
-                user.updated_at = datetime.now()
-                session.add(user)
-                session.commit()
+            result = session.exec(
+                update(User)
+                .where(User.id == user_id)
+                .values(is_active=False, updated_at=datetime.now())
+            )
+            session.commit()
+            if result.rowcount > 0:
+                _resolve_user_id_by_email.cache_clear()
                 return True
             return False
 
 
+# Monotonic version of the meetings table, bumped on every write.
+# Caches key on it so stale entries fall out of use the moment any
+# meeting changes - no explicit invalidation hooks needed. Kept global
+# rather than per-user because status updates and deletes only know the
+# meeting_id, and resolving affected users would cost an extra query.
+_meetings_data_version = 0
+
+
+def _bump_meetings_version() -> None:
+    global _meetings_data_version
+    _meetings_data_version += 1
+
+
+def get_meetings_version() -> int:
+    """Current meetings-table version for cache keying"""
+    return _meetings_data_version
+
+
+# Read-through cache for short range lookups: one entry per (user,
+# version, day). The version in the key retires every entry the moment
+# a meeting changes, and overlapping probes during a scheduling run
+# collapse to cache hits. Ranges longer than this go straight to SQL -
+# a cold fill per day would cost more than the one range query.
+_DAY_CACHE_MAX_RANGE = timedelta(days=3)
+
+
+@lru_cache(maxsize=8192)
+def _user_meetings_for_day(user_id: str, version: int, day: date) -> tuple:
+    day_start = datetime(day.year, day.month, day.day)
+    # Bucket end stops just short of midnight so a meeting starting
+    # exactly on the boundary lands in one bucket, not two
+    day_end = day_start + timedelta(days=1) - timedelta(microseconds=1)
+    return tuple(MeetingService._query_user_meetings_in_range(user_id, day_start, day_end))
+
+
+def _participant_user_ids(participants: List[str]) -> List[str]:
+    """Map participant entries to user IDs for junction rows.
+
+    The MCP tool passes emails (and pre-creates those users); the seed
+    scripts pass user IDs straight through. Entries that resolve to no
+    user are skipped rather than tripping the foreign-key constraint.
+    """
+    ids = []
+    for entry in participants:
+        uid = _resolve_user_id_by_email(entry) if '@' in entry else entry
+        if uid:
+            ids.append(uid)
+    return ids
+
+
 # Meeting CRUD Operations
 class MeetingService:
     """Service for meeting-related database operations"""
-    
+
     @staticmethod
-    def create_meeting(meeting_data: MeetingCreate, organizer_email: str) -> str:
-        """Create a new meeting"""
+    def create_meeting(meeting_data: MeetingCreate, organizer_email: str) -> tuple:
+        """Create a new meeting.
+
+        Returns (meeting_id, created_at, status_value) so callers can
+        build their response DTO directly instead of re-selecting the
+        row they just inserted.
+        """
         with db_manager.get_session() as session:
             # Generate unique ID
-            meeting_id = f"meeting_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-            
-            # Look up organizer user ID from email within the same session
-            from sqlmodel import select
-            organizer_statement = select(User.id).where(User.email == organizer_email)
-            organizer_id = session.exec(organizer_statement).first()
+            meeting_id = _new_id("meeting")
             
+            # Resolve organizer email through the cached lookup - repeat
+            # organizers skip the SELECT entirely
+            organizer_id = _resolve_user_id_by_email(organizer_email)
+
             if not organizer_id:
                 raise ValueError(f"Organizer user not found: {organizer_email}")
             
@@ -164,7 +389,6 @@ class MeetingService:
                 description=meeting_data.description,
                 start_time=meeting_data.start_time,
                 end_time=end_time,
-                duration_minutes=meeting_data.duration_minutes,
                 organizer_id=organizer_id,  # Use the ID directly
                 participants=meeting_data.participants,
                 meeting_type=meeting_data.meeting_type,
@@ -174,78 +398,249 @@ class MeetingService:
             )
             
             session.add(meeting)
+            # Keep the junction table in sync for indexed membership
+            # queries; emails resolve to IDs first so the FK holds
+            session.add_all([
+                MeetingParticipant(meeting_id=meeting_id, user_id=uid)
+                for uid in _participant_user_ids(meeting_data.participants)
+            ])
             session.commit()
-            # Return just the ID to avoid detached instance issues
-            return meeting_id
-    
+            _bump_meetings_version()
+            # Return plain values (no ORM instance) to avoid detached
+            # instance issues - created_at/status were assigned client-side
+            return meeting_id, meeting.created_at, meeting.status.value
+
+    @staticmethod
+    def bulk_create_meetings(items: List[tuple]) -> List[str]:
+        """Create multiple meetings in one transaction and return their IDs.
+
+        Each item is a (MeetingCreate, organizer_id) pair. All rows share
+        one session and one commit instead of a round-trip per meeting.
+        """
+        with db_manager.get_session() as session:
+            now = datetime.now()
+            meetings = []
+            meeting_ids = []
+            for meeting_data, organizer_id in items:
+                meeting_id = _new_id("meeting")
+                meeting_ids.append(meeting_id)
+                end_time = meeting_data.start_time + timedelta(minutes=meeting_data.duration_minutes)
+                meetings.append(Meeting(
+                    id=meeting_id,
+                    created_at=now,
+                    title=meeting_data.title,
+                    description=meeting_data.description,
+                    start_time=meeting_data.start_time,
+                    end_time=end_time,
+                    organizer_id=organizer_id,
+                    participants=meeting_data.participants,
+                    meeting_type=meeting_data.meeting_type,
+                    location=meeting_data.location,
+                    meeting_url=meeting_data.meeting_url,
+                    recurring_pattern=meeting_data.recurring_pattern
+                ))
+            session.add_all(meetings)
+            session.add_all([
+                MeetingParticipant(meeting_id=meeting.id, user_id=uid)
+                for meeting in meetings
+                for uid in _participant_user_ids(meeting.participants)
+            ])
+            session.commit()
+            _bump_meetings_version()
+            # Return the generated IDs to avoid detached instance issues
+            return meeting_ids
+
     @staticmethod
     def get_meeting_by_id(meeting_id: str) -> Optional[Meeting]:
         """Get meeting by ID"""
         with db_manager.get_session() as session:
             return session.get(Meeting, meeting_id)
     
+    @staticmethod
+    def get_meetings_by_ids(meeting_ids: List[str]) -> List[Meeting]:
+        """Get many meetings in one WHERE id IN (...) query"""
+        with db_manager.get_session() as session:
+            statement = select(Meeting).where(Meeting.id.in_(meeting_ids))
+            return session.exec(statement).all()
+
     @staticmethod
     def get_meetings_by_user(user_id: str) -> List[Meeting]:
         """Get all meetings for a user (as organizer or participant)"""
         with db_manager.get_session() as session:
-            # Get meetings where user is organizer
-            organizer_statement = select(Meeting).where(Meeting.organizer_id == user_id)
-            organizer_meetings = session.exec(organizer_statement).all()
-            
-            # Get meetings where user is participant (JSON search)
-            participant_statement = select(Meeting).where(Meeting.participants.contains(user_id))
-            participant_meetings = session.exec(participant_statement).all()
-            
-            # Combine and deduplicate
-            all_meetings = list(set(organizer_meetings + participant_meetings))
-            return sorted(all_meetings, key=lambda m: m.start_time)
-    
+            # One OR query instead of two SELECTs plus Python-side dedup -
+            # membership goes through the indexed junction table rather
+            # than a LIKE scan over the participants JSON
+            # lambda_stmt caches the compiled SQL by statement structure,
+            # so repeat calls only bind new parameters instead of
+            # rebuilding and recompiling the expression tree
+            statement = lambda_stmt(lambda: select(Meeting).where(
+                or_(
+                    Meeting.organizer_id == user_id,
+                    Meeting.id.in_(
+                        select(MeetingParticipant.meeting_id).where(
+                            MeetingParticipant.user_id == user_id
+                        )
+                    )
+                )
+            ).order_by(Meeting.start_time))
+            return session.execute(statement).scalars().all()
+
+    @staticmethod
+    def iter_meetings_in_range(start_date: datetime, end_date: datetime, chunk_size: int = 500):
+        """Stream meetings in a date range in server-side chunks"""
+        with db_manager.get_session() as session:
+            statement = lambda_stmt(lambda: select(Meeting).where(
+                Meeting.start_time >= start_date,
+                Meeting.start_time <= end_date
+            ))
+            result = session.execute(
+                statement, execution_options={"yield_per": chunk_size}
+            ).scalars()
+            for meeting in result:
+                yield meeting
+
     @staticmethod
     def get_meetings_in_range(start_date: datetime, end_date: datetime) -> List[Meeting]:
         """Get meetings within a date range"""
+        return list(MeetingService.iter_meetings_in_range(start_date, end_date))
+
+    @staticmethod
+    def get_user_meetings_in_range(user_id: str, start_date: datetime, end_date: datetime) -> List[Meeting]:
+        """Get user's meetings within a date range.
+
+        Short windows (conflict probes, density checks) are served from
+        the per-day read-through cache; wider analytical ranges go
+        straight to the single range query, where one SELECT beats a
+        cold cache fill per day.
+        """
+        if end_date - start_date > _DAY_CACHE_MAX_RANGE:
+            return MeetingService._query_user_meetings_in_range(user_id, start_date, end_date)
+        version = get_meetings_version()
+        meetings: List[Meeting] = []
+        day = start_date.date()
+        last_day = end_date.date()
+        while day <= last_day:
+            meetings.extend(_user_meetings_for_day(user_id, version, day))
+            day += timedelta(days=1)
+        return [m for m in meetings if start_date <= m.start_time <= end_date]
+
+    @staticmethod
+    def _query_user_meetings_in_range(user_id: str, start_date: datetime, end_date: datetime) -> List[Meeting]:
+        """Run the actual range query (uncached)"""
         with db_manager.get_session() as session:
-            statement = select(Meeting).where(
+            # Single query with the role OR folded into the range predicate;
+            # membership uses the indexed junction table. Precompiled via
+            # lambda_stmt - only the three parameters change per call.
+            statement = lambda_stmt(lambda: select(Meeting).where(
+                or_(
+                    Meeting.organizer_id == user_id,
+                    Meeting.id.in_(
+                        select(MeetingParticipant.meeting_id).where(
+                            MeetingParticipant.user_id == user_id
+                        )
+                    )
+                ),
                 Meeting.start_time >= start_date,
                 Meeting.start_time <= end_date
-            )
-            return session.exec(statement).all()
+            ).order_by(Meeting.start_time))
+            return session.execute(statement).scalars().all()
     
     @staticmethod
-    def get_user_meetings_in_range(user_id: str, start_date: datetime, end_date: datetime) -> List[Meeting]:
-        """Get user's meetings within a date range"""
+    def get_users_meetings_in_range(
+        user_ids: List[str], start_date: datetime, end_date: datetime
+    ) -> Dict[str, List[Meeting]]:
+        """Get meetings in a range for many users at once.
+
+        Two set-based queries (organizer rows plus junction-table
+        participant rows) replace one round-trip per user; results are
+        grouped per requested user with duplicates removed.
+        """
+        grouped: Dict[str, List[Meeting]] = defaultdict(list)
+        seen = set()
         with db_manager.get_session() as session:
-            # Organizer meetings
-            organizer_statement = select(Meeting).where(
-                Meeting.organizer_id == user_id,
+            organizer_rows = session.exec(
+                select(Meeting.organizer_id, Meeting).where(
+                    Meeting.organizer_id.in_(user_ids),
+                    Meeting.start_time >= start_date,
+                    Meeting.start_time <= end_date
+                )
+            ).all()
+            participant_rows = session.exec(
+                select(MeetingParticipant.user_id, Meeting)
+                .join(Meeting, Meeting.id == MeetingParticipant.meeting_id)
+                .where(
+                    MeetingParticipant.user_id.in_(user_ids),
+                    Meeting.start_time >= start_date,
+                    Meeting.start_time <= end_date
+                )
+            ).all()
+        for user_id, meeting in (*organizer_rows, *participant_rows):
+            if (user_id, meeting.id) not in seen:
+                seen.add((user_id, meeting.id))
+                grouped[user_id].append(meeting)
+        for meetings in grouped.values():
+            meetings.sort(key=lambda meeting: meeting.start_time)
+        return grouped
+
+    @staticmethod
+    def get_users_meeting_totals(
+        user_ids: List[str], start_date: datetime, end_date: datetime
+    ) -> Dict[str, Tuple[int, int]]:
+        """Get (meeting_count, total_minutes) per user for a date range.
+
+        The count and duration sum run inside SQLite over a UNION of
+        organizer and participant rows (the UNION also removes
+        duplicates), so no Meeting objects are hydrated at all.
+        """
+        organizer_rows = (
+            select(
+                Meeting.organizer_id.label("user_id"),
+                Meeting.id.label("meeting_id"),
+                Meeting.duration_minutes.label("duration_minutes")
+            ).where(
+                Meeting.organizer_id.in_(user_ids),
                 Meeting.start_time >= start_date,
                 Meeting.start_time <= end_date
             )
-            organizer_meetings = session.exec(organizer_statement).all()
-            
-            # Participant meetings
-            participant_statement = select(Meeting).where(
-                Meeting.participants.contains(user_id),
+        )
+        participant_rows = (
+            select(
+                MeetingParticipant.user_id,
+                Meeting.id,
+                Meeting.duration_minutes
+            )
+            .join(Meeting, Meeting.id == MeetingParticipant.meeting_id)
+            .where(
+                MeetingParticipant.user_id.in_(user_ids),
                 Meeting.start_time >= start_date,
                 Meeting.start_time <= end_date
             )
-            participant_meetings = session.exec(participant_statement).all()
-            
-            # Combine and deduplicate
-            all_meetings = list(set(organizer_meetings + participant_meetings))
-            return sorted(all_meetings, key=lambda m: m.start_time)
-    
+        )
+        membership = organizer_rows.union(participant_rows).subquery()
+        with db_manager.get_session() as session:
+            rows = session.exec(
+                select(
+                    membership.c.user_id,
+                    func.count(),
+                    func.coalesce(func.sum(membership.c.duration_minutes), 0)
+                ).group_by(membership.c.user_id)
+            ).all()
+        return {user_id: (count, total) for user_id, count, total in rows}
+
     @staticmethod
-    def update_meeting_status(meeting_id: str, status: str) -> Optional[Meeting]:
-        """Update meeting status"""
+    def update_meeting_status(meeting_id: str, status: str) -> bool:
+        """Update meeting status with a single UPDATE - no row hydration"""
         with db_manager.get_session() as session:
-            meeting = session.get(Meeting, meeting_id)
-            if meeting:
-                meeting.status = status
-                meeting.updated_at = datetime.now()
-                session.add(meeting)
-                session.commit()
-                session.refresh(meeting)
-            return meeting
+            result = session.exec(
+                update(Meeting)
+                .where(Meeting.id == meeting_id)
+                .values(status=status, updated_at=datetime.now())
+            )
+            session.commit()
+            if result.rowcount > 0:
+                _bump_meetings_version()
+                return True
+            return False
     
     @staticmethod
     def delete_meeting(meeting_id: str) -> bool:
@@ -253,8 +648,15 @@ class MeetingService:
         with db_manager.get_session() as session:
             meeting = session.get(Meeting, meeting_id)
             if meeting:
+                # Remove junction rows alongside the meeting itself
+                participant_rows = session.exec(
+                    select(MeetingParticipant).where(MeetingParticipant.meeting_id == meeting_id)
+                ).all()
+                for row in participant_rows:
+                    session.delete(row)
                 session.delete(meeting)
                 session.commit()
+                _bump_meetings_version()
                 return True
             return False
 
@@ -269,7 +671,7 @@ class MeetingInsightService:
                       analysis_data: Dict[str, Any] = None) -> MeetingInsight:
         """Create meeting insight"""
         with db_manager.get_session() as session:
-            insight_id = f"insight_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+            insight_id = _new_id("insight")
             
             insight = MeetingInsight(
                 id=insight_id,
@@ -285,6 +687,35 @@ class MeetingInsightService:
             session.refresh(insight)
             return insight
     
+    @staticmethod
+    def bulk_create_insights(items: List[Dict[str, Any]]) -> List[str]:
+        """Create multiple insights in one transaction and return their IDs.
+
+        Each item is a dict with the create_insight arguments
+        (meeting_id, effectiveness_score, insights, recommendations and
+        optional analysis_data). One session and one commit for the batch.
+        """
+        with db_manager.get_session() as session:
+            now = datetime.now()
+            insights = []
+            insight_ids = []
+            for item in items:
+                insight_id = _new_id("insight")
+                insight_ids.append(insight_id)
+                insights.append(MeetingInsight(
+                    id=insight_id,
+                    analyzed_at=now,
+                    meeting_id=item["meeting_id"],
+                    effectiveness_score=item["effectiveness_score"],
+                    insights=item["insights"],
+                    recommendations=item["recommendations"],
+                    analysis_data=item.get("analysis_data") or {}
+                ))
+            session.add_all(insights)
+            session.commit()
+            # Return the generated IDs to avoid detached instance issues
+            return insight_ids
+
     @staticmethod
     def get_insight_by_meeting(meeting_id: str) -> Optional[MeetingInsight]:
         """Get insight for a meeting"""
@@ -293,18 +724,36 @@ class MeetingInsightService:
             return session.exec(statement).first()
     
     @staticmethod
-    def get_insights_by_user(user_id: str) -> List[MeetingInsight]:
-        """Get all insights for meetings organized by user"""
+    def iter_insights_by_user(user_id: str, chunk_size: int = 500):
+        """Stream insights for meetings organized by a user"""
         with db_manager.get_session() as session:
             statement = select(MeetingInsight).join(Meeting).where(Meeting.organizer_id == user_id)
-            return session.exec(statement).all()
+            result = session.execute(
+                statement.execution_options(yield_per=chunk_size)
+            ).scalars()
+            for insight in result:
+                yield insight
+
+    @staticmethod
+    def get_insights_by_user(user_id: str) -> List[MeetingInsight]:
+        """Get all insights for meetings organized by user"""
+        return list(MeetingInsightService.iter_insights_by_user(user_id))
 
 
 # Database initialization
 def init_database():
-    """Initialize database and create tables"""
+    """Initialize database, create tables and pre-warm the pool"""
     print("Initializing database...")
     db_manager.create_tables()
+    # Pre-warm the connection pool: check out pool_size connections and
+    # return them, so the first tool calls reuse already-opened
+    # connections (file open + PRAGMA setup paid once at startup)
+    connections = [
+        db_manager.engine.connect()
+        for _ in range(db_manager.engine.pool.size())
+    ]
+    for connection in connections:
+        connection.close()
     print("Database initialized successfully!")
 
 
@@ -321,10 +770,14 @@ def check_database_health() -> Dict[str, Any]:
     """Check database connection and health"""
     try:
         with db_manager.get_session() as session:
-            # Try to query a simple count
-            user_count = len(session.exec(select(User)).all())
-            meeting_count = len(session.exec(select(Meeting)).all())
-            
+            # Both counts in one statement via scalar subqueries - a single
+            # round-trip, and SQLite counts rows instead of materializing them
+            user_count, meeting_count = session.exec(select(
+                select(func.count()).select_from(User).scalar_subquery(),
+                select(func.count()).select_from(Meeting).scalar_subquery()
+            )).one()
+
+
             return {
                 "status": "healthy",
                 "database_url": db_manager.database_url,
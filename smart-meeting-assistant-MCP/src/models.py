@@ -10,6 +10,7 @@ from typing import Optional, List, Dict, Any
 from enum import Enum
 
 from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlalchemy import Computed, Index, Integer
 from pydantic import BaseModel, field_validator
 
 
@@ -72,7 +73,15 @@ class User(SQLModel, table=True):
 
 class Meeting(SQLModel, table=True):
     """Meeting model with participants and scheduling details"""
-    
+
+    # Composite index so organizer + date-range queries are B-tree seeks
+    # instead of full table scans; end_time rides along so overlap checks
+    # (start_time < X AND end_time > Y) resolve from the index pages
+    # without touching the row
+    __table_args__ = (
+        Index("ix_meeting_organizer_range", "organizer_id", "start_time", "end_time"),
+    )
+
     id: str = Field(primary_key=True)
     title: str = Field(index=True)
     description: Optional[str] = Field(default=None)
@@ -80,7 +89,18 @@ class Meeting(SQLModel, table=True):
     # Scheduling
     start_time: datetime = Field(index=True)
     end_time: datetime = Field(index=True)
-    duration_minutes: int = Field(ge=1, le=480)  # 1 minute to 8 hours
+    # Derived by SQLite from the timestamps so it can never drift from
+    # them; writes must not set it (MeetingCreate still validates the
+    # requested duration before end_time is computed). ROUND before the
+    # CAST - julianday float error often lands the product a hair under
+    # the integer, and a bare CAST truncates 30-minute meetings to 29.
+    duration_minutes: Optional[int] = Field(
+        default=None,
+        sa_column=Column(
+            Integer,
+            Computed("CAST(ROUND((julianday(end_time) - julianday(start_time)) * 1440) AS INTEGER)", persisted=True)
+        )
+    )
     
     # People
     organizer_id: str = Field(foreign_key="user.id")
@@ -118,6 +138,18 @@ class Meeting(SQLModel, table=True):
         return v
 
 
+class MeetingParticipant(SQLModel, table=True):
+    """Junction table mapping meetings to participants.
+
+    Membership queries become indexed joins instead of LIKE scans over
+    the participants JSON column (which stays on Meeting for API
+    compatibility).
+    """
+
+    meeting_id: str = Field(foreign_key="meeting.id", primary_key=True)
+    user_id: str = Field(foreign_key="user.id", primary_key=True, index=True)
+
+
 class MeetingInsight(SQLModel, table=True):
     """AI-generated insights and analysis for meetings"""
     
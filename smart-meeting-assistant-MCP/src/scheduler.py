@@ -9,11 +9,95 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
 import pendulum
 from pendulum import DateTime
 
 from .models import Meeting, User, MeetingType, SchedulingPreferences, OptimalSlotResponse
-from .database import MeetingService, UserService
+from .database import MeetingService, UserService, get_meetings_version
+
+# Any meeting within this distance of a slot counts against it - covers
+# the overlap, back-to-back and buffer-violation cases in one window
+_CONFLICT_BUFFER_SECONDS = 15 * 60
+_EMPTY_BUSY = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+# Time-of-day and day-of-week preference scores as lookup tables - the
+# old if/elif cascade ran per candidate slot; indexing these with whole
+# hour/weekday arrays scores every slot in one NumPy expression. Values
+# preserve the original branch outcomes exactly.
+_HOUR_SCORE = np.zeros(24, dtype=np.float64)
+_HOUR_SCORE[:8] = -25    # early hours
+_HOUR_SCORE[9:12] = 15   # morning boost
+_HOUR_SCORE[13:15] = -10 # lunch time
+_HOUR_SCORE[16:18] = -5  # late afternoon
+_HOUR_SCORE[19:] = -25   # late hours
+_DAY_SCORE = np.array([5, 0, 0, 0, -5, 0, 0], dtype=np.float64)
+
+# Matching reasoning fragments, looked up only for slots that make the cut
+_HOUR_REASON = ("Outside normal hours",) * 8 + (None,) + ("Good morning time",) * 3 \
+    + (None,) + ("Lunch time penalty",) * 2 + (None,) + ("Late afternoon",) * 2 \
+    + (None,) + ("Outside normal hours",) * 5
+_DAY_REASON = ("Monday energy", None, None, None, "Friday afternoon", None, None)
+
+# Memoized detect_conflicts results. Keys include the meetings-table
+# version, so entries written before any meeting change simply stop
+# matching - no invalidation hooks. Bounded LFU: repeated probes of the
+# same user/window (alternative suggestions, client re-polls) dominate,
+# so eviction drops the least-used entry.
+_CONFLICT_CACHE: Dict[tuple, list] = {}
+_CONFLICT_CACHE_FREQ: Dict[tuple, int] = {}
+_CONFLICT_CACHE_MAX = 4096
+# Windows longer than this are one-off analytical queries - not worth caching
+_CONFLICT_CACHE_MAX_WINDOW = timedelta(hours=8)
+
+
+def _conflict_cache_get(key: tuple):
+    hit = _CONFLICT_CACHE.get(key)
+    if hit is not None:
+        _CONFLICT_CACHE_FREQ[key] = _CONFLICT_CACHE_FREQ.get(key, 0) + 1
+    return hit
+
+
+def _conflict_cache_put(key: tuple, value: list) -> None:
+    if len(_CONFLICT_CACHE) >= _CONFLICT_CACHE_MAX:
+        coldest = min(_CONFLICT_CACHE_FREQ, key=_CONFLICT_CACHE_FREQ.get)
+        del _CONFLICT_CACHE[coldest]
+        del _CONFLICT_CACHE_FREQ[coldest]
+    _CONFLICT_CACHE[key] = value
+    _CONFLICT_CACHE_FREQ[key] = 1
+
+
+# Density buckets for get_meeting_density: searchsorted over the
+# thresholds picks the recommendation, same boundaries as the old cascade
+_DENSITY_THRESHOLDS = np.array([25.0, 50.0, 75.0])
+_DENSITY_RECOMMENDATIONS = (
+    "Light meeting day - good for scheduling",
+    "Moderate meeting load - schedule with care",
+    "Heavy meeting day - avoid non-essential meetings",
+    "Overloaded day - consider rescheduling",
+)
+
+
+# Classification codes map positions in _CONFLICT_TYPE_NAMES; 0 = clear
+_CONFLICT_TYPE_NAMES = (None, 'overlap', 'back_to_back', 'buffer_violation')
+
+
+def _classify_conflicts(starts: np.ndarray, ends: np.ndarray,
+                        target_start: int, target_end: int,
+                        buffer_seconds: int) -> np.ndarray:
+    """Classify each busy interval against a target range in one pass.
+
+    Returns an int code per meeting (see _CONFLICT_TYPE_NAMES). The
+    np.select order mirrors the original if/elif chain: a touching
+    meeting is back-to-back, never a buffer violation.
+    """
+    overlap = (target_start < ends) & (starts < target_end)
+    back_to_back = (ends == target_start) | (starts == target_end)
+    buffer_violation = (
+        ((target_end <= starts) & (starts - target_end < buffer_seconds))
+        | ((ends <= target_start) & (target_start - ends < buffer_seconds))
+    )
+    return np.select([overlap, back_to_back, buffer_violation], [1, 2, 3], default=0)
 
 
 @dataclass
@@ -63,57 +147,54 @@ class SchedulingEngine:
         Returns:
             List of conflict details
         """
+        cache_key = None
+        if end_time - start_time <= _CONFLICT_CACHE_MAX_WINDOW:
+            cache_key = (user_id, start_time, end_time, get_meetings_version())
+            cached = _conflict_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         conflicts = []
-        
+
         # Get user's existing meetings in an extended range (for buffer checking)
         extended_start = start_time - timedelta(hours=2)
         extended_end = end_time + timedelta(hours=2)
         
+        # The organizer/start_time composite index makes this window
+        # query an O(log M + k) B-tree seek, so only the k nearby
+        # meetings reach the classification loop below
         existing_meetings = self.meeting_service.get_user_meetings_in_range(
             user_id, extended_start, extended_end
         )
-        
-        # Convert to pendulum for easier timezone handling
-        target_start = pendulum.instance(start_time)
-        target_end = pendulum.instance(end_time)
-        
-        for meeting in existing_meetings:
-            meeting_start = pendulum.instance(meeting.start_time)
-            meeting_end = pendulum.instance(meeting.end_time)
-            
-            # Check for direct overlap
-            if self._times_overlap(target_start, target_end, meeting_start, meeting_end):
-                conflicts.append(ConflictDetails(
-                    meeting_id=meeting.id,
-                    title=meeting.title,
-                    start_time=meeting_start,
-                    end_time=meeting_end,
-                    participants=meeting.participants,
-                    conflict_type='overlap'
-                ))
-            
-            # Check for back-to-back meetings (potential issue)
-            elif self._is_back_to_back(target_start, target_end, meeting_start, meeting_end):
-                conflicts.append(ConflictDetails(
-                    meeting_id=meeting.id,
-                    title=meeting.title,
-                    start_time=meeting_start,
-                    end_time=meeting_end,
-                    participants=meeting.participants,
-                    conflict_type='back_to_back'
-                ))
-            
-            # Check for buffer violations (meetings too close)
-            elif self._violates_buffer(target_start, target_end, meeting_start, meeting_end, minutes=15):
+
+        # Classify every nearby meeting at once on int epoch-seconds:
+        # three vectorized comparisons replace the per-meeting branch tree
+        if existing_meetings:
+            target_start = int(np.datetime64(start_time, 's').view(np.int64))
+            target_end = int(np.datetime64(end_time, 's').view(np.int64))
+            meeting_starts = np.array(
+                [m.start_time for m in existing_meetings], dtype='datetime64[s]'
+            ).view(np.int64)
+            meeting_ends = np.array(
+                [m.end_time for m in existing_meetings], dtype='datetime64[s]'
+            ).view(np.int64)
+            codes = _classify_conflicts(
+                meeting_starts, meeting_ends,
+                target_start, target_end, _CONFLICT_BUFFER_SECONDS
+            )
+            for idx in np.nonzero(codes)[0]:
+                meeting = existing_meetings[idx]
                 conflicts.append(ConflictDetails(
                     meeting_id=meeting.id,
                     title=meeting.title,
-                    start_time=meeting_start,
-                    end_time=meeting_end,
+                    start_time=meeting.start_time,
+                    end_time=meeting.end_time,
                     participants=meeting.participants,
-                    conflict_type='buffer_violation'
+                    conflict_type=_CONFLICT_TYPE_NAMES[codes[idx]]
                 ))
-        
+
+        if cache_key is not None:
+            _conflict_cache_put(cache_key, conflicts)
         return conflicts
     
     def find_optimal_slots(self, 
@@ -138,178 +219,157 @@ class SchedulingEngine:
         if not preferences:
             preferences = SchedulingPreferences()
         
-        # Generate potential time slots
-        potential_slots = self._generate_time_slots(
+        # Generate potential time slots (epoch-second arrays)
+        slot_starts, slot_ends = self._generate_time_slots(
             date_range_start, date_range_end, duration_minutes, preferences
         )
-        
-        # Score each slot
+
+        # Fetch every participant's meetings once for the whole range and
+        # index them as sorted epoch arrays - each slot is then checked
+        # with two binary searches per participant instead of a
+        # detect_conflicts call (DB query + pendulum objects) per pair
+        busy_index = self._build_busy_index(
+            participants, date_range_start, date_range_end
+        )
+
+        if slot_starts.size == 0:
+            return []
+
+        # Per-participant conflict counts for every slot at once: two
+        # vectorized binary searches per participant. Widening by the
+        # buffer covers overlap, back-to-back and buffer violations.
+        window_starts = slot_starts - _CONFLICT_BUFFER_SECONDS
+        window_ends = slot_ends + _CONFLICT_BUFFER_SECONDS
+        conflict_counts = np.zeros((len(participants), slot_starts.size), dtype=np.int64)
+        for row, participant_id in enumerate(participants):
+            starts, ends = busy_index.get(participant_id, _EMPTY_BUSY)
+            if starts.size:
+                ended_before = np.searchsorted(ends, window_starts, side='right')
+                started_after = starts.size - np.searchsorted(starts, window_ends, side='left')
+                conflict_counts[row] = starts.size - ended_before - started_after
+
+        # Branchless scoring over the whole slot axis
+        hours = (slot_starts % 86400) // 3600
+        weekdays = (slot_starts // 86400 + 3) % 7
+        long_meeting = ((slot_ends % 86400) // 3600 - hours) >= 2
+        all_available = (conflict_counts == 0).all(axis=0)
+        scores = (100.0
+                  + _HOUR_SCORE[hours]
+                  + _DAY_SCORE[weekdays]
+                  - 30.0 * conflict_counts.sum(axis=0)
+                  + 20.0 * all_available
+                  - 10.0 * long_meeting)
+        np.maximum(scores, 0.0, out=scores)
+
+        # Responses (and reasoning strings) only for the top 10 viable
+        # slots - argpartition keeps selection O(S) and only the ten
+        # winners pay the full sort
+        if scores.size > 10:
+            top = np.argpartition(-scores, 10)[:10]
+            order = top[np.argsort(-scores[top], kind='stable')]
+        else:
+            order = np.argsort(-scores, kind='stable')
         scored_slots = []
-        for slot in potential_slots:
-            score_info = self._score_time_slot(slot, participants, preferences)
-            
-            if score_info['score'] > 0:  # Only include viable slots
-                scored_slots.append(OptimalSlotResponse(
-                    start_time=slot.start_time.naive,
-                    end_time=slot.end_time.naive,
-                    score=score_info['score'],
-                    participants_available=score_info['available'],
-                    participants_conflicts=score_info['conflicted'],
-                    reasoning=score_info['reasoning']
-                ))
-        
-        # Sort by score (highest first) and return top 10
-        scored_slots.sort(key=lambda x: x.score, reverse=True)
-        return scored_slots[:10]
+        for idx in order:
+            if scores[idx] <= 0:
+                break
+            available, conflicted, reasoning_parts = [], [], []
+            for row, participant_id in enumerate(participants):
+                count = int(conflict_counts[row, idx])
+                if count:
+                    conflicted.append(participant_id)
+                    reasoning_parts.append(f"Conflicts for {participant_id}: {count}")
+                else:
+                    available.append(participant_id)
+            if all_available[idx] and participants:
+                reasoning_parts.append("All participants available")
+            for reason in (_HOUR_REASON[hours[idx]], _DAY_REASON[weekdays[idx]]):
+                if reason:
+                    reasoning_parts.append(reason)
+            if long_meeting[idx]:
+                reasoning_parts.append("Long meeting")
+            scored_slots.append(OptimalSlotResponse(
+                start_time=np.datetime64(slot_starts[idx], 's').item(),
+                end_time=np.datetime64(slot_ends[idx], 's').item(),
+                score=float(scores[idx]),
+                participants_available=available,
+                participants_conflicts=conflicted,
+                reasoning='; '.join(reasoning_parts) if reasoning_parts else "Standard slot"
+            ))
+        return scored_slots
     
-    def _generate_time_slots(self, 
-                           start_date: datetime, 
-                           end_date: datetime, 
+    def _generate_time_slots(self,
+                           start_date: datetime,
+                           end_date: datetime,
                            duration_minutes: int,
-                           preferences: SchedulingPreferences) -> List[TimeSlot]:
-        """Generate potential meeting time slots"""
-        slots = []
-        
+                           preferences: SchedulingPreferences) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate candidate slots as int64 epoch-second (starts, ends).
+
+        Each working day contributes one C-level arange of 30-minute
+        starts instead of a Python loop allocating a TimeSlot object per
+        step; callers convert back to datetimes only for slots that
+        survive scoring.
+        """
         # Convert to pendulum for easier manipulation
         current = pendulum.instance(start_date)
         end = pendulum.instance(end_date)
-        
+
         # Parse preferred times
         pref_start_hour, pref_start_minute = map(int, preferences.preferred_start_time.split(':'))
         pref_end_hour, pref_end_minute = map(int, preferences.preferred_end_time.split(':'))
-        
+
+        # Identical for every day: how many 30-minute starts fit in the
+        # preferred window, and their offsets from the window start
+        window_minutes = ((pref_end_hour * 60 + pref_end_minute)
+                          - (pref_start_hour * 60 + pref_start_minute))
+        slots_per_day = max(0, (window_minutes - duration_minutes) // 30 + 1)
+        offsets = np.arange(slots_per_day, dtype=np.int64) * 1800
+
+        day_starts = []
         while current < end:
+            weekday = current.weekday()
             # Skip weekends for now (can be made configurable)
-            if current.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                current = current.next(pendulum.MONDAY).at(pref_start_hour, pref_start_minute)
+            if weekday >= 5:  # Saturday = 5, Sunday = 6
+                current = current.add(days=7 - weekday)
                 continue
-            
-            # Generate slots for each day within preferred hours
             day_start = current.at(pref_start_hour, pref_start_minute)
-            day_end = current.at(pref_end_hour, pref_end_minute)
-            
-            # Generate slots every 30 minutes during preferred hours
-            slot_start = day_start
-            while slot_start + timedelta(minutes=duration_minutes) <= day_end:
-                slot_end = slot_start + timedelta(minutes=duration_minutes)
-                
-                slots.append(TimeSlot(
-                    start_time=slot_start,
-                    end_time=slot_end
-                ))
-                
-                # Move to next slot (30-minute intervals)
-                slot_start = slot_start + timedelta(minutes=30)
-            
-            # Move to next day
-            current = current.next(pendulum.MONDAY if current.weekday() == 4 else current.add(days=1))
-        
-        return slots
+            day_starts.append(int(np.datetime64(day_start.naive, 's').view(np.int64)))
+            # Friday jumps to Monday, other weekdays advance one day
+            current = current.add(days=3 if weekday == 4 else 1)
+
+        if not day_starts or not slots_per_day:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        starts = (np.array(day_starts, dtype=np.int64)[:, None] + offsets).ravel()
+        return starts, starts + duration_minutes * 60
     
-    def _score_time_slot(self, slot: TimeSlot, participants: List[str], preferences: SchedulingPreferences) -> Dict[str, Any]:
-        """
-        Score a time slot based on participant availability and preferences.
-        
-        Returns:
-            Dict with score, available participants, conflicted participants, and reasoning
+    def _build_busy_index(self,
+                          participants: List[str],
+                          range_start: datetime,
+                          range_end: datetime) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Build sorted busy-interval arrays per participant for a range.
+
+        One bulk fetch covers the whole search window (extended for
+        buffer checks); each participant maps to independently sorted
+        int64 epoch-second arrays of meeting starts and ends.
         """
-        score = 100.0  # Start with perfect score
-        available_participants = []
-        conflicted_participants = []
-        reasoning_parts = []
-        
-        # Check each participant's availability
-        for participant_id in participants:
-            conflicts = self.detect_conflicts(
-                participant_id,
-                slot.start_time.naive,
-                slot.end_time.naive
-            )
-            
-            if conflicts:
-                conflicted_participants.append(participant_id)
-                # Major penalty for conflicts
-                conflict_penalty = len(conflicts) * 30
-                score -= conflict_penalty
-                reasoning_parts.append(f"Conflicts for {participant_id}: {len(conflicts)}")
-            else:
-                available_participants.append(participant_id)
-        
-        # Bonus for all participants available
-        if len(available_participants) == len(participants):
-            score += 20
-            reasoning_parts.append("All participants available")
-        
-        # Score based on time of day preferences
-        hour = slot.start_time.hour
-        
-        # Morning boost (9-11 AM)
-        if 9 <= hour <= 11:
-            score += 15
-            reasoning_parts.append("Good morning time")
-        
-        # Afternoon penalty (1-2 PM - lunch time)
-        elif 13 <= hour <= 14:
-            score -= 10
-            reasoning_parts.append("Lunch time penalty")
-        
-        # Late afternoon slight penalty (4-5 PM)
-        elif 16 <= hour <= 17:
-            score -= 5
-            reasoning_parts.append("Late afternoon")
-        
-        # Early/late hours penalty
-        elif hour < 8 or hour > 18:
-            score -= 25
-            reasoning_parts.append("Outside normal hours")
-        
-        # Day of week scoring
-        weekday = slot.start_time.weekday()
-        if weekday == 0:  # Monday
-            score += 5
-            reasoning_parts.append("Monday energy")
-        elif weekday == 4:  # Friday
-            score -= 5
-            reasoning_parts.append("Friday afternoon")
-        
-        # Buffer time scoring
-        # (This would check for adequate breaks between meetings)
-        
-        # Meeting duration scoring
-        if slot.end_time.hour - slot.start_time.hour >= 2:
-            score -= 10
-            reasoning_parts.append("Long meeting")
-        
-        # Ensure score is not negative
-        score = max(0, score)
-        
-        return {
-            'score': score,
-            'available': available_participants,
-            'conflicted': conflicted_participants,
-            'reasoning': '; '.join(reasoning_parts) if reasoning_parts else "Standard slot"
-        }
-    
-    def _times_overlap(self, start1: DateTime, end1: DateTime, start2: DateTime, end2: DateTime) -> bool:
-        """Check if two time ranges overlap"""
-        return start1 < end2 and start2 < end1
-    
-    def _is_back_to_back(self, start1: DateTime, end1: DateTime, start2: DateTime, end2: DateTime) -> bool:
-        """Check if meetings are back-to-back"""
-        return end1 == start2 or end2 == start1
-    
-    def _violates_buffer(self, start1: DateTime, end1: DateTime, start2: DateTime, end2: DateTime, minutes: int = 15) -> bool:
-        """Check if meetings violate buffer time"""
-        buffer = timedelta(minutes=minutes)
-        
-        # Check if there's insufficient buffer between meetings
-        if end1 <= start2:  # Meeting 1 ends before meeting 2 starts
-            return (start2 - end1) < buffer
-        elif end2 <= start1:  # Meeting 2 ends before meeting 1 starts
-            return (start1 - end2) < buffer
-        
-        return False
-    
+        meetings_by_user = self.meeting_service.get_users_meetings_in_range(
+            participants,
+            range_start - timedelta(hours=2),
+            range_end + timedelta(hours=2)
+        )
+        busy_index = {}
+        for user_id, meetings in meetings_by_user.items():
+            starts = np.array(
+                [m.start_time for m in meetings], dtype='datetime64[s]'
+            ).view(np.int64)
+            ends = np.array(
+                [m.end_time for m in meetings], dtype='datetime64[s]'
+            ).view(np.int64)
+            starts.sort()
+            ends.sort()
+            busy_index[user_id] = (starts, ends)
+        return busy_index
+
     def get_meeting_density(self, user_id: str, date: datetime) -> Dict[str, Any]:
         """
         Calculate meeting density for a user on a specific date.
@@ -321,12 +381,14 @@ class SchedulingEngine:
         Returns:
             Dictionary with density metrics
         """
-        # Get meetings for the day
-        day_start = pendulum.instance(date).start_of('day')
-        day_end = pendulum.instance(date).end_of('day')
-        
+        # Plain datetime arithmetic for the day bounds - no pendulum
+        # instances for a value we only need as a naive range. The end
+        # stops just short of midnight, matching the old end_of('day').
+        day_start = datetime(date.year, date.month, date.day)
+        day_end = day_start + timedelta(days=1) - timedelta(microseconds=1)
+
         meetings = self.meeting_service.get_user_meetings_in_range(
-            user_id, day_start.naive, day_end.naive
+            user_id, day_start, day_end
         )
         
         if not meetings:
@@ -335,6 +397,9 @@ class SchedulingEngine:
                 'total_meeting_time': 0,
                 'free_time': 480,  # 8 hours
                 'density_score': 0,
+                'max_concurrent': 0,
+                'total_gap_minutes': 0,
+                'back_to_back_count': 0,
                 'recommendation': 'Good day to schedule meetings'
             }
         
@@ -342,22 +407,48 @@ class SchedulingEngine:
         working_hours = 8 * 60  # 480 minutes
         free_time = working_hours - total_meeting_time
         density_score = (total_meeting_time / working_hours) * 100
+
+        # One sweep over the day's sorted endpoints answers the overlap
+        # and gap questions together - linear instead of pairwise, and
+        # future per-day features read these instead of re-scanning
+        events = sorted(
+            [(int(np.datetime64(m.start_time, 's').view(np.int64)), 1) for m in meetings]
+            + [(int(np.datetime64(m.end_time, 's').view(np.int64)), -1) for m in meetings]
+        )
+        active = 0
+        max_concurrent = 0
+        last_end = None
+        total_gap_seconds = 0
+        back_to_back_count = 0
+        for timestamp, delta in events:
+            if delta == 1:
+                if active == 0 and last_end is not None:
+                    gap = timestamp - last_end
+                    total_gap_seconds += gap
+                    if gap < _CONFLICT_BUFFER_SECONDS:
+                        back_to_back_count += 1
+                active += 1
+                if active > max_concurrent:
+                    max_concurrent = active
+            else:
+                active -= 1
+                if active == 0:
+                    last_end = timestamp
         
-        # Generate recommendation
-        if density_score < 25:
-            recommendation = "Light meeting day - good for scheduling"
-        elif density_score < 50:
-            recommendation = "Moderate meeting load - schedule with care"
-        elif density_score < 75:
-            recommendation = "Heavy meeting day - avoid non-essential meetings"
-        else:
-            recommendation = "Overloaded day - consider rescheduling"
-        
+        # Bucket lookup instead of the threshold cascade
+        recommendation = _DENSITY_RECOMMENDATIONS[
+            int(np.searchsorted(_DENSITY_THRESHOLDS, density_score, side='right'))
+        ]
+
+
         return {
             'total_meetings': len(meetings),
             'total_meeting_time': total_meeting_time,
             'free_time': free_time,
             'density_score': density_score,
+            'max_concurrent': max_concurrent,
+            'total_gap_minutes': total_gap_seconds // 60,
+            'back_to_back_count': back_to_back_count,
             'recommendation': recommendation
         }
     
@@ -373,6 +464,16 @@ class SchedulingEngine:
         Returns:
             List of alternative time slots
         """
+        # If the requested slot is already clear for everyone, skip the
+        # whole 7-day search - the per-participant checks here are cached
+        # and far cheaper than scoring hundreds of candidate slots
+        original_end = original_start + timedelta(minutes=duration_minutes)
+        if not any(
+            self.detect_conflicts(participant_id, original_start, original_end)
+            for participant_id in participants
+        ):
+            return []
+
         # Search for alternatives in the next 7 days
         search_start = original_start
         search_end = original_start + timedelta(days=7)
@@ -385,7 +486,6 @@ class SchedulingEngine:
         )
         
         # Filter out the original time if it's in the results
-        original_end = original_start + timedelta(minutes=duration_minutes)
         alternatives = [
             alt for alt in alternatives
             if not (alt.start_time <= original_start < alt.end_time or 